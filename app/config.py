@@ -6,16 +6,90 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./todo.db"
+    # "sync" (threadpool + sync driver) or "async" (aiosqlite/asyncpg)
+    database_mode: str = "sync"
+    async_database_url: Optional[str] = None  # Derived from database_url if unset
+    # Primary/foreign keys: "string" (32 hex chars) or "binary" (16 bytes).
+    # Choose before creating the database; the API always uses hex strings.
+    id_storage: str = "string"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800  # seconds; -1 disables
+    db_pool_pre_ping: bool = True
+    # Read replica for GET handlers; unset sends every query to the primary
+    database_replica_url: Optional[str] = None
+    # Reads stay on the primary this long after a user commits a write
+    read_your_writes_seconds: float = 5
+    read_your_writes_cache_size: int = 65536
+
+    # SQLite pragmas applied on every new connection; None leaves the
+    # SQLite default in place
+    sqlite_journal_mode: Optional[str] = "wal"
+    sqlite_synchronous: Optional[str] = "normal"
+    sqlite_busy_timeout_ms: Optional[int] = 5000
+    sqlite_mmap_size: Optional[int] = 268435456  # bytes
+    sqlite_cache_size: Optional[int] = -65536  # negative = KiB, positive = pages
+    sqlite_temp_store: Optional[str] = "memory"
+    sqlite_foreign_keys: Optional[bool] = True
+
+    # Keyset pagination for GET /lists and GET /lists/{listId}/tasks
+    page_default_limit: int = 100
+    page_max_limit: int = 1000
+
+    # Largest array accepted by POST /lists/{listId}/tasks/batch
+    task_batch_max_size: int = 500
 
     # JWT
     secret_key: str = "your-secret-key-here"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    refresh_token_expire_days: int = 30
+    token_cache_size: int = 4096
+
+    # Basic auth credential cache
+    basic_auth_cache_size: int = 1024
+    basic_auth_cache_ttl_seconds: int = 300
+
+    # Authenticated principal cache (user_id -> id/email/username/is_active)
+    principal_cache_size: int = 4096
+    principal_cache_ttl_seconds: int = 60
+
+    # Password hashing ("bcrypt" or "argon2"; argon2 needs argon2-cffi)
+    password_hash_scheme: str = "bcrypt"
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 4
+    password_hash_calibrate_on_startup: bool = True
+
+    # Rate limiting (token buckets: burst capacity, refill per minute)
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "app.utils.rate_limit.InMemoryRateLimitBackend"
+    rate_limit_login_ip_capacity: int = 20
+    rate_limit_login_ip_per_minute: float = 20
+    rate_limit_login_account_capacity: int = 10
+    rate_limit_login_account_per_minute: float = 5
+    rate_limit_register_ip_capacity: int = 10
+    rate_limit_register_ip_per_minute: float = 2
+
+    # Password hashing executor ("process" or "thread")
+    password_hash_executor: str = "process"
+    password_hash_workers: Optional[int] = None
+    password_hash_max_pending: int = 64
 
     # Application
     app_name: str = "Todo List API"
     debug: bool = True
     api_v1_prefix: str = "/v1"
+    internal_endpoints_enabled: bool = False  # /internal/stats
+    # Required in X-Internal-Token for /internal/*; unset rejects every request
+    internal_token: Optional[str] = None
+
+    # Startup (lifespan); nothing touches the database at import time
+    migrate_on_startup: bool = False  # run `alembic upgrade head` on startup
+    startup_warmup: bool = True
+    warmup_pool_connections: int = 2
 
     class Config:
         env_file = ".env"
@@ -1,25 +1,236 @@
-from sqlalchemy import create_engine
+from typing import Any, Callable, List, Optional, TypeVar, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import MetaData, create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine as _create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.pool_metrics import InstrumentedQueuePool, PoolMetrics
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    database = make_url(url).database
+    return not database or database == ":memory:" or "mode=memory" in url
+
+
+def sqlite_pragmas() -> List[str]:
+    """
+    Daftar PRAGMA SQLite dari settings, dijalankan pada setiap koneksi baru
+    """
+    pragmas = [
+        ("journal_mode", settings.sqlite_journal_mode),
+        ("synchronous", settings.sqlite_synchronous),
+        ("busy_timeout", settings.sqlite_busy_timeout_ms),
+        ("mmap_size", settings.sqlite_mmap_size),
+        ("cache_size", settings.sqlite_cache_size),
+        ("temp_store", settings.sqlite_temp_store),
+        ("foreign_keys", settings.sqlite_foreign_keys),
+    ]
+    statements = []
+    for name, value in pragmas:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "ON" if value else "OFF"
+        statements.append(f"PRAGMA {name}={value}")
+    return statements
+
+
+def apply_sqlite_pragmas(engine: Engine) -> None:
+    """
+    Mendaftarkan event connect yang menjalankan PRAGMA SQLite dari settings
+    """
+    statements = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(url: str) -> Engine:
+    """
+    Membuat engine dengan konfigurasi connection pool dari settings
+    """
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+
+    # In-memory SQLite uses a single connection per thread; no queue to size
+    if not (url.startswith("sqlite") and _is_memory_sqlite(url)):
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+
+    db_engine = create_engine(url, **options)
+    if url.startswith("sqlite"):
+        apply_sqlite_pragmas(db_engine)
+    return db_engine
+
+
+def to_async_url(url: str) -> str:
+    """
+    Mengubah URL database sync menjadi URL dengan driver async
+    """
+    parsed = make_url(url)
+    drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    backend = parsed.get_backend_name()
+    if backend not in drivers:
+        raise ValueError(f"No async driver configured for database: {backend}")
+    return parsed.set(drivername=drivers[backend]).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    """
+    Membuat async engine dengan konfigurasi connection pool dari settings
+    """
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if not (url.startswith("sqlite") and _is_memory_sqlite(url)):
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+
+    db_engine = _create_async_engine(url, **options)
+    if url.startswith("sqlite"):
+        apply_sqlite_pragmas(db_engine.sync_engine)
+    return db_engine
+
 
 # Database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args=(
-        {"check_same_thread": False} if "sqlite" in settings.database_url else {}
-    ),
+engine = create_db_engine(settings.database_url)
+pool_metrics = PoolMetrics().attach(engine)
+
+# Session factory; objects keep their loaded state after commit so write
+# paths can return them without a refresh SELECT
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
 )
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Read replica (optional); GET handlers read from it through get_read_db
+replica_engine: Optional[Engine] = None
+replica_pool_metrics: Optional[PoolMetrics] = None
+ReplicaSessionLocal: Optional[sessionmaker] = None
+
+# Async engines and session factories, only created in async database mode
+async_engine: Optional[AsyncEngine] = None
+async_pool_metrics: Optional[PoolMetrics] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+async_replica_engine: Optional[AsyncEngine] = None
+async_replica_pool_metrics: Optional[PoolMetrics] = None
+AsyncReplicaSessionLocal: Optional[async_sessionmaker] = None
+
+if settings.database_mode == "async":
+    async_engine = create_async_db_engine(
+        settings.async_database_url or to_async_url(settings.database_url)
+    )
+    async_pool_metrics = PoolMetrics().attach(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    if settings.database_replica_url:
+        async_replica_engine = create_async_db_engine(
+            to_async_url(settings.database_replica_url)
+        )
+        async_replica_pool_metrics = PoolMetrics().attach(
+            async_replica_engine.sync_engine
+        )
+        AsyncReplicaSessionLocal = async_sessionmaker(
+            async_replica_engine, autoflush=False, expire_on_commit=False
+        )
+elif settings.database_mode == "sync":
+    if settings.database_replica_url:
+        replica_engine = create_db_engine(settings.database_replica_url)
+        replica_pool_metrics = PoolMetrics().attach(replica_engine)
+        ReplicaSessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=replica_engine,
+        )
+else:
+    raise ValueError(f"Unknown database mode: {settings.database_mode}")
+
+# Users who committed a write recently; their reads stay on the primary until
+# the replica has had time to catch up (read-your-writes). The pins live in
+# this process only: with several workers, a read served by another worker
+# can still hit a lagging replica (use sticky sessions or keep the replica
+# lag below the window)
+primary_pins = TTLCache(
+    maxsize=settings.read_your_writes_cache_size,
+    ttl=settings.read_your_writes_seconds,
+)
+
+
+def pin_to_primary(user_id: str) -> None:
+    """
+    Mengarahkan pembacaan user ke primary selama read_your_writes_seconds
+    """
+    primary_pins.set(user_id, True)
+
 
-# Base class for models
-Base = declarative_base()
+def is_pinned_to_primary(user_id: str) -> bool:
+    return primary_pins.get(user_id) is not None
 
 
-def get_db():
+@event.listens_for(Session, "after_flush")
+def _mark_session_written(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_session_dml(orm_execute_state):
+    # INSERT/UPDATE/DELETE statements (e.g. ... RETURNING) write without a flush
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _pin_writer_to_primary(session):
+    # user_id is recorded on the session by the authentication dependency
+    if session.info.pop("wrote", False) and session.info.get("user_id"):
+        pin_to_primary(session.info["user_id"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_session_written(session):
+    session.info.pop("wrote", None)
+
+
+# Base class for models. Deterministic constraint names let migrations
+# refer to (and batch mode recreate) constraints by name.
+NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
+
+
+def get_sync_db():
     """
     Dependency function untuk mendapatkan database session
     """
@@ -28,3 +239,62 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency function untuk mendapatkan async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_sync_replica_db():
+    """
+    Dependency function untuk session replica; None bila replica tidak dikonfigurasi
+    """
+    if ReplicaSessionLocal is None:
+        yield None
+        return
+
+    db = ReplicaSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_replica_db():
+    """
+    Dependency function untuk async session replica; None bila replica tidak dikonfigurasi
+    """
+    if AsyncReplicaSessionLocal is None:
+        yield None
+        return
+
+    async with AsyncReplicaSessionLocal() as db:
+        yield db
+
+
+# Routers depend on get_db; DATABASE_MODE decides which session it yields
+if settings.database_mode == "async":
+    get_db = get_async_db
+    get_replica_db = get_async_replica_db
+else:
+    get_db = get_sync_db
+    get_replica_db = get_sync_replica_db
+
+T = TypeVar("T")
+AnySession = Union[Session, AsyncSession]
+
+
+async def run_db(db: AnySession, fn: Callable[..., T], *args: Any) -> T:
+    """
+    Menjalankan fn(session, *args) yang memakai Session sync.
+
+    Dengan AsyncSession, fn dijalankan lewat run_sync sehingga I/O-nya memakai
+    driver async tanpa thread. Dengan Session biasa, fn dijalankan di threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args)
+    return await run_in_threadpool(fn, db, *args)
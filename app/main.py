@@ -1,12 +1,66 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
-from app.database import Base, engine
-from app.routers import auth, lists, tasks
+from app.database import async_engine, engine
+from app.routers import auth, internal, lists, tasks
+from app.utils.hashing import password_hasher
+from app.utils.security import calibrate_password_hash, describe_password_hash
+from app.utils.warmup import warmup
+
+logger = logging.getLogger("uvicorn.error")
+
+
+async def log_password_hash_cost() -> None:
+    """Ukur biaya satu hash password dan catat ke log"""
+    ms = await run_in_threadpool(calibrate_password_hash)
+    logger.info("Password hashing: %s, %.1f ms per hash", describe_password_hash(), ms)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup/shutdown aplikasi. Import app.main tidak menyentuh database;
+    migrasi hanya dijalankan di sini bila MIGRATE_ON_STARTUP aktif.
+    """
+    if settings.migrate_on_startup:
+        # Alembic is only imported when the app migrates its own database
+        from app.utils.migrations import upgrade_database
+
+        await run_in_threadpool(upgrade_database)
+
+    if settings.startup_warmup:
+        try:
+            timings = await warmup(engine, async_engine)
+        except SQLAlchemyError as exc:
+            logger.warning("Startup warmup could not reach the database: %s", exc)
+        else:
+            logger.info(
+                "Startup warmup: %s",
+                ", ".join(f"{name} {ms:.1f} ms" for name, ms in timings.items()),
+            )
+
+    calibration = None
+    if settings.password_hash_calibrate_on_startup:
+        # Runs in the background so hashing samples do not delay readiness
+        calibration = asyncio.create_task(log_password_hash_cost())
+
+    yield
+
+    if calibration is not None:
+        calibration.cancel()
+        with suppress(asyncio.CancelledError):
+            await calibration
+
+    # Stop the password hashing worker pool
+    password_hasher.shutdown()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -31,6 +85,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -40,6 +95,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination headers must be readable from browsers
+    expose_headers=["Link", "X-Next-Cursor"],
 )
 
 # Include routers with API prefix
@@ -47,6 +104,14 @@ app.include_router(auth.router, prefix=settings.api_v1_prefix)
 app.include_router(lists.router, prefix=settings.api_v1_prefix)
 app.include_router(tasks.router, prefix=settings.api_v1_prefix)
 
+if settings.internal_endpoints_enabled:
+    if not settings.internal_token:
+        logger.warning(
+            "INTERNAL_ENDPOINTS_ENABLED is set without INTERNAL_TOKEN; "
+            "/internal/* will refuse every request"
+        )
+    app.include_router(internal.router)
+
 
 @app.get("/")
 def read_root():
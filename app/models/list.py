@@ -1,19 +1,31 @@
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import IdType, TimestampType
 
 
 class List(Base):
     __tablename__ = "lists"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(IdType, primary_key=True, index=True)
     name = Column(String, nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    user_id = Column(IdType, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(TimestampType, server_default=func.now())
+    updated_at = Column(TimestampType, onupdate=func.now())
 
     # Relationships
     owner = relationship("User", back_populates="lists")
-    tasks = relationship("Task", back_populates="list", cascade="all, delete-orphan")
+    # Tasks are removed by ON DELETE CASCADE, not loaded and deleted one by one
+    tasks = relationship(
+        "Task",
+        back_populates="list",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # get_user_lists: WHERE user_id = ? keyset-paged on (created_at, id)
+        Index("ix_lists_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.types import IdType
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(IdType, primary_key=True, index=True)
+    user_id = Column(
+        IdType,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    family_id = Column(String, nullable=False, index=True)  # One family per login
+    token_hash = Column(String, unique=True, index=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked = Column(Boolean, default=False)  # Set once rotated or revoked
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,19 +1,46 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, String, func
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import IdType, TimestampType
 
 
 class Task(Base):
     __tablename__ = "tasks"
 
-    id = Column(String, primary_key=True, index=True)
-    list_id = Column(String, ForeignKey("lists.id"), nullable=False)
+    id = Column(IdType, primary_key=True, index=True)
+    list_id = Column(IdType, ForeignKey("lists.id", ondelete="CASCADE"), nullable=False)
     description = Column(String, nullable=False)
     completed = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at = Column(TimestampType, server_default=func.now())
+    updated_at = Column(TimestampType, onupdate=func.now())
 
     # Relationships
     list = relationship("List", back_populates="tasks")
+
+    __table_args__ = (
+        # get_tasks_by_list?completed=..., keyset pages on (created_at, id)
+        Index(
+            "ix_tasks_list_id_completed_created_at_id",
+            "list_id",
+            "completed",
+            "created_at",
+            "id",
+        ),
+        # get_tasks_by_list: keyset pages on (created_at, id) within a list
+        Index("ix_tasks_list_id_created_at_id", "list_id", "created_at", "id"),
+        # get_tasks_by_list?sort=description
+        Index("ix_tasks_list_id_description_id", "list_id", "description", "id"),
+        # List-scoped task scans that seek or order by id
+        Index("ix_tasks_list_id_id", "list_id", "id"),
+    )
+
+
+# get_tasks_by_list?sort=updated_at orders by the last modification time,
+# which is created_at until the task is first updated
+Index(
+    "ix_tasks_list_id_updated_at_id",
+    Task.list_id,
+    func.coalesce(Task.updated_at, Task.created_at),
+    Task.id,
+)
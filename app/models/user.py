@@ -3,12 +3,13 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.models.types import IdType
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(IdType, primary_key=True, index=True)
     username = Column(
         String, unique=True, index=True, nullable=True
     )  # Made nullable for email-only users
@@ -20,7 +21,13 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationship
-    lists = relationship("List", back_populates="owner", cascade="all, delete-orphan")
+    # Lists (and their tasks) are removed by ON DELETE CASCADE
+    lists = relationship(
+        "List",
+        back_populates="owner",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     def __str__(self):
         """String representation of user"""
@@ -1,12 +1,11 @@
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from app.config import settings
-from app.database import get_db
-from app.models.user import User
+from app.database import AnySession, get_db, pin_to_primary
 from app.schemas.user import (
+    RefreshTokenRequest,
     RegisterResponse,
     Token,
     UserCreate,
@@ -14,17 +13,37 @@ from app.schemas.user import (
     UserLoginUsername,
     UserResponse,
 )
-from app.services.auth_service import AuthService
-from app.utils.dependencies import get_current_user, get_current_user_flexible
+from app.services.auth_service import AsyncAuthService
+from app.services.token_service import AsyncTokenService
+from app.utils.auth_cache import Principal
+from app.utils.dependencies import get_current_user_flexible, get_read_db
+from app.utils.rate_limit import client_ip, rate_limiter
 from app.utils.security import create_access_token
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def _build_token(message: str, user_id: str, refresh_token: str) -> Token:
+    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
+    access_token = create_access_token(
+        data={"sub": user_id}, expires_delta=access_token_expires
+    )
+
+    return Token(
+        message=message,
+        token=access_token,
+        token_type="bearer",
+        expires_in=settings.access_token_expire_minutes,
+        refresh_token=refresh_token,
+    )
+
+
 @router.post(
     "/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED
 )
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(
+    user_data: UserCreate, request: Request, db: AnySession = Depends(get_db)
+):
     """
     Mendaftarkan pengguna baru dengan email dan password
 
@@ -32,8 +51,11 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     - Email: Must be a valid email format
     - Password: Minimum 10 characters, alphanumeric with at least one special character
     """
-    auth_service = AuthService(db)
-    user = auth_service.create_user(user_data)
+    rate_limiter.check_register(client_ip(request))
+
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.create_user(user_data)
+    pin_to_primary(user.id)
 
     return RegisterResponse(
         message="User registered successfully.", userId=user.id, email=user.email
@@ -41,38 +63,40 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token, status_code=status.HTTP_200_OK)
-def login_email(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login_email(
+    user_data: UserLogin, request: Request, db: AnySession = Depends(get_db)
+):
     """
     Login pengguna dengan email dan password dan mendapatkan bearer token
     """
-    auth_service = AuthService(db)
-    user = auth_service.authenticate_user_email(user_data.email, user_data.password)
+    rate_limiter.check_login(client_ip(request), user_data.email)
+
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.authenticate_user_email(
+        user_data.email, user_data.password
+    )
 
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password"
         )
 
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
-    )
+    refresh_token = await AsyncTokenService(db).issue_refresh_token(user.id)
 
-    return Token(
-        message="Login successful.",
-        token=access_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes,
-    )
+    return _build_token("Login successful.", user.id, refresh_token)
 
 
 @router.post("/login-username", response_model=Token, status_code=status.HTTP_200_OK)
-def login_username(user_data: UserLoginUsername, db: Session = Depends(get_db)):
+async def login_username(
+    user_data: UserLoginUsername, request: Request, db: AnySession = Depends(get_db)
+):
     """
     Login pengguna dengan username dan password (backward compatibility)
     """
-    auth_service = AuthService(db)
-    user = auth_service.authenticate_user_username(
+    rate_limiter.check_login(client_ip(request), user_data.username)
+
+    auth_service = AsyncAuthService(db)
+    user = await auth_service.authenticate_user_username(
         user_data.username, user_data.password
     )
 
@@ -82,22 +106,40 @@ def login_username(user_data: UserLoginUsername, db: Session = Depends(get_db)):
             detail="Invalid username or password",
         )
 
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
-    access_token = create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
-    )
+    refresh_token = await AsyncTokenService(db).issue_refresh_token(user.id)
 
-    return Token(
-        message="Login successful.",
-        token=access_token,
-        token_type="bearer",
-        expires_in=settings.access_token_expire_minutes,
+    return _build_token("Login successful.", user.id, refresh_token)
+
+
+@router.post("/refresh", response_model=Token, status_code=status.HTTP_200_OK)
+async def refresh_access_token(
+    token_data: RefreshTokenRequest, db: AnySession = Depends(get_db)
+):
+    """
+    Menukar refresh token dengan bearer token dan refresh token baru (rotasi)
+
+    Refresh token hanya dapat dipakai sekali. Pemakaian ulang token lama
+    mencabut seluruh sesi login yang bersangkutan.
+    """
+    user_id, refresh_token = await AsyncTokenService(db).rotate_refresh_token(
+        token_data.refresh_token
     )
 
+    return _build_token("Token refreshed.", user_id, refresh_token)
+
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
-def get_current_user_info(current_user: User = Depends(get_current_user_flexible)):
+async def get_current_user_info(
+    current_user: Principal = Depends(get_current_user_flexible),
+    db: AnySession = Depends(get_read_db),
+):
     """
     Get current authenticated user information
     """
-    return current_user
+    user = await AsyncAuthService(db).get_user_by_id(current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+        )
+
+    return user
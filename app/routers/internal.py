@@ -0,0 +1,71 @@
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.config import settings
+from app.database import (
+    async_engine,
+    async_pool_metrics,
+    async_replica_engine,
+    async_replica_pool_metrics,
+    engine,
+    pool_metrics,
+    replica_engine,
+    replica_pool_metrics,
+)
+from app.utils.auth_cache import credential_cache, principal_cache
+from app.utils.hashing import password_hasher
+from app.utils.security import token_cache
+
+
+def require_internal_access(x_internal_token: Optional[str] = Header(None)) -> None:
+    """
+    Dependency untuk endpoint internal: X-Internal-Token harus cocok dengan
+    INTERNAL_TOKEN. Tanpa INTERNAL_TOKEN semua request ditolak; alamat klien
+    tidak dipercaya karena di balik reverse proxy semuanya tampak loopback
+    """
+    allowed = (
+        bool(settings.internal_token)
+        and x_internal_token is not None
+        and secrets.compare_digest(
+            x_internal_token.encode(), settings.internal_token.encode()
+        )
+    )
+    if not allowed:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_access)],
+)
+
+
+@router.get("/stats")
+def get_internal_stats():
+    """
+    Statistik internal: connection pool, cache autentikasi dan password executor
+    """
+    stats = {
+        "database_pool": pool_metrics.snapshot(engine),
+        "caches": {
+            "basic_auth_credentials": credential_cache.stats(),
+            "principals": principal_cache.stats(),
+            "tokens": token_cache.stats(),
+        },
+        "password_hasher": password_hasher.stats(),
+    }
+    if async_engine is not None:
+        stats["async_database_pool"] = async_pool_metrics.snapshot(
+            async_engine.sync_engine
+        )
+    if replica_engine is not None:
+        stats["replica_database_pool"] = replica_pool_metrics.snapshot(replica_engine)
+    if async_replica_engine is not None:
+        stats["async_replica_database_pool"] = async_replica_pool_metrics.snapshot(
+            async_replica_engine.sync_engine
+        )
+    return stats
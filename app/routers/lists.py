@@ -1,30 +1,37 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.database import get_db
-from app.models.user import User
+from app.database import AnySession, get_db
 from app.schemas.list import ListCreate, ListResponse, ListUpdate
-from app.services.lists_service import ListService
-from app.utils.dependencies import get_current_active_user
+from app.services.lists_service import AsyncListService
+from app.utils.auth_cache import Principal
+from app.utils.dependencies import get_current_active_user, get_read_db
+from app.utils.pagination import set_next_page_headers
 
 router = APIRouter(prefix="/lists", tags=["lists"])
 
 
 @router.get("/", response_model=List[ListResponse])
-def get_user_lists(
-    current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)
+async def get_user_lists(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_read_db),
 ):
     """
-    Mendapatkan semua daftar tugas pengguna
+    Mendapatkan daftar tugas pengguna per halaman (urut waktu pembuatan);
+    halaman berikutnya ada di header Link / X-Next-Cursor
     """
-    list_service = ListService(db)
-    lists = list_service.get_user_lists(current_user)
+    list_service = AsyncListService(db)
+    page = await list_service.get_user_lists(current_user, limit, cursor)
+    set_next_page_headers(request, response, page.next_cursor)
 
     # Convert to response format
     response_lists = []
-    for list_item in lists:
+    for list_item in page.items:
         response_lists.append(
             ListResponse(
                 id=list_item.id,
@@ -39,16 +46,16 @@ def get_user_lists(
 
 
 @router.post("/", response_model=ListResponse, status_code=status.HTTP_201_CREATED)
-def create_list(
+async def create_list(
     list_data: ListCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Membuat daftar tugas baru
     """
-    list_service = ListService(db)
-    new_list = list_service.create_list(list_data, current_user)
+    list_service = AsyncListService(db)
+    new_list = await list_service.create_list(list_data, current_user)
 
     return ListResponse(
         id=new_list.id,
@@ -60,16 +67,16 @@ def create_list(
 
 
 @router.get("/{listId}", response_model=ListResponse)
-def get_list_by_id(
+async def get_list_by_id(
     listId: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Mendapatkan daftar tugas berdasarkan ID
     """
-    list_service = ListService(db)
-    list_item = list_service.get_list_by_id(listId, current_user)
+    list_service = AsyncListService(db)
+    list_item = await list_service.get_list_by_id(listId, current_user)
 
     if not list_item:
         raise HTTPException(
@@ -86,17 +93,17 @@ def get_list_by_id(
 
 
 @router.put("/{listId}", response_model=ListResponse)
-def update_list(
+async def update_list(
     listId: str,
     list_data: ListUpdate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Memperbarui daftar tugas
     """
-    list_service = ListService(db)
-    updated_list = list_service.update_list(listId, list_data, current_user)
+    list_service = AsyncListService(db)
+    updated_list = await list_service.update_list(listId, list_data, current_user)
 
     return ListResponse(
         id=updated_list.id,
@@ -108,15 +115,15 @@ def update_list(
 
 
 @router.delete("/{listId}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_list(
+async def delete_list(
     listId: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Menghapus daftar tugas
     """
-    list_service = ListService(db)
-    list_service.delete_list(listId, current_user)
+    list_service = AsyncListService(db)
+    await list_service.delete_list(listId, current_user)
 
     return None
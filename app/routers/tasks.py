@@ -1,32 +1,60 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.database import get_db
-from app.models.user import User
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate
-from app.services.task_service import TaskService
-from app.utils.dependencies import get_current_active_user
+from app.database import AnySession, get_db
+from app.schemas.task import (
+    TaskBulkResult,
+    TaskBulkSelection,
+    TaskCreate,
+    TaskResponse,
+    TaskSort,
+    TaskUpdate,
+)
+from app.services.task_service import AsyncTaskService
+from app.utils.auth_cache import Principal
+from app.utils.dependencies import get_current_active_user, get_read_db
+from app.utils.pagination import set_next_page_headers
 
 router = APIRouter(tags=["tasks"])
 
 
 @router.get("/lists/{listId}/tasks", response_model=List[TaskResponse])
-def get_tasks_in_list(
+async def get_tasks_in_list(
     listId: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    completed: Optional[bool] = None,
+    created_after: Optional[datetime] = None,
+    updated_after: Optional[datetime] = None,
+    sort: TaskSort = "created_at",
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_read_db),
 ):
     """
-    Mendapatkan semua tugas dalam daftar
+    Mendapatkan tugas dalam daftar per halaman, difilter (completed,
+    created_after, updated_after) dan diurutkan (sort) di database;
+    halaman berikutnya ada di header Link / X-Next-Cursor
     """
-    task_service = TaskService(db)
-    tasks = task_service.get_tasks_by_list(listId, current_user)
+    task_service = AsyncTaskService(db)
+    page = await task_service.get_tasks_by_list(
+        listId,
+        current_user,
+        limit,
+        cursor,
+        completed=completed,
+        created_after=created_after,
+        updated_after=updated_after,
+        sort=sort,
+    )
+    set_next_page_headers(request, response, page.next_cursor)
 
     # Convert to response format
     response_tasks = []
-    for task in tasks:
+    for task in page.items:
         response_tasks.append(
             TaskResponse(
                 id=task.id,
@@ -46,17 +74,17 @@ def get_tasks_in_list(
     response_model=TaskResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_task(
+async def create_task(
     listId: str,
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Menambahkan tugas baru ke daftar
     """
-    task_service = TaskService(db)
-    new_task = task_service.create_task(listId, task_data, current_user)
+    task_service = AsyncTaskService(db)
+    new_task = await task_service.create_task(listId, task_data, current_user)
 
     return TaskResponse(
         id=new_task.id,
@@ -68,17 +96,124 @@ def create_task(
     )
 
 
+@router.post(
+    "/lists/{listId}/tasks/batch",
+    response_model=List[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_batch(
+    listId: str,
+    tasks_data: List[TaskCreate],
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menambahkan banyak tugas ke daftar dalam satu transaksi
+    """
+    task_service = AsyncTaskService(db)
+    new_tasks = await task_service.create_tasks(listId, tasks_data, current_user)
+
+    return [
+        TaskResponse(
+            id=task.id,
+            listId=task.list_id,
+            description=task.description,
+            completed=task.completed,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+        )
+        for task in new_tasks
+    ]
+
+
+@router.post("/lists/{listId}/tasks/complete", response_model=TaskBulkResult)
+async def complete_tasks_in_list(
+    listId: str,
+    selection: TaskBulkSelection,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menandai banyak tugas dalam daftar sebagai selesai (ids atau all=true)
+    """
+    task_service = AsyncTaskService(db)
+    count = await task_service.set_tasks_completed(
+        listId, selection, True, current_user
+    )
+
+    return TaskBulkResult(count=count)
+
+
+@router.post("/lists/{listId}/tasks/incomplete", response_model=TaskBulkResult)
+async def incomplete_tasks_in_list(
+    listId: str,
+    selection: TaskBulkSelection,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menandai banyak tugas dalam daftar sebagai belum selesai (ids atau all=true)
+    """
+    task_service = AsyncTaskService(db)
+    count = await task_service.set_tasks_completed(
+        listId, selection, False, current_user
+    )
+
+    return TaskBulkResult(count=count)
+
+
+@router.delete("/lists/{listId}/tasks", response_model=TaskBulkResult)
+async def clear_tasks_in_list(
+    listId: str,
+    completed: bool = Query(..., description="Harus true"),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menghapus tugas yang sudah selesai (?completed=true wajib). Menghapus
+    semua tugas hanya lewat POST .../tasks/delete dengan {"all": true}
+    """
+    if not completed:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Only completed=true is supported",
+        )
+
+    task_service = AsyncTaskService(db)
+    count = await task_service.delete_tasks(listId, current_user, completed=completed)
+
+    return TaskBulkResult(count=count)
+
+
+@router.post("/lists/{listId}/tasks/delete", response_model=TaskBulkResult)
+async def delete_tasks_in_list(
+    listId: str,
+    selection: TaskBulkSelection,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menghapus banyak tugas dalam daftar (ids atau all=true)
+    """
+    task_service = AsyncTaskService(db)
+    count = await task_service.delete_tasks(
+        listId, current_user, ids=selection.ids, all=selection.all
+    )
+
+    return TaskBulkResult(count=count)
+
+
 @router.get("/tasks/{taskId}", response_model=TaskResponse)
-def get_task_by_id(
+async def get_task_by_id(
     taskId: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_read_db),
 ):
     """
     Mendapatkan tugas berdasarkan ID
     """
-    task_service = TaskService(db)
-    task = task_service.get_task_by_id(taskId, current_user)
+    task_service = AsyncTaskService(db)
+    task = await task_service.get_task_by_id(taskId, current_user)
 
     if not task:
         raise HTTPException(
@@ -96,17 +231,17 @@ def get_task_by_id(
 
 
 @router.put("/tasks/{taskId}", response_model=TaskResponse)
-def update_task(
+async def update_task(
     taskId: str,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Memperbarui tugas
     """
-    task_service = TaskService(db)
-    updated_task = task_service.update_task(taskId, task_data, current_user)
+    task_service = AsyncTaskService(db)
+    updated_task = await task_service.update_task(taskId, task_data, current_user)
 
     return TaskResponse(
         id=updated_task.id,
@@ -118,16 +253,60 @@ def update_task(
     )
 
 
+@router.post("/tasks/{taskId}/complete", response_model=TaskResponse)
+async def complete_task(
+    taskId: str,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menandai tugas sebagai selesai
+    """
+    task_service = AsyncTaskService(db)
+    task = await task_service.set_task_completed(taskId, True, current_user)
+
+    return TaskResponse(
+        id=task.id,
+        listId=task.list_id,
+        description=task.description,
+        completed=task.completed,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+    )
+
+
+@router.post("/tasks/{taskId}/incomplete", response_model=TaskResponse)
+async def incomplete_task(
+    taskId: str,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
+):
+    """
+    Menandai tugas sebagai belum selesai
+    """
+    task_service = AsyncTaskService(db)
+    task = await task_service.set_task_completed(taskId, False, current_user)
+
+    return TaskResponse(
+        id=task.id,
+        listId=task.list_id,
+        description=task.description,
+        completed=task.completed,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+    )
+
+
 @router.delete("/tasks/{taskId}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     taskId: str,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AnySession = Depends(get_db),
 ):
     """
     Menghapus tugas
     """
-    task_service = TaskService(db)
-    task_service.delete_task(taskId, current_user)
+    task_service = AsyncTaskService(db)
+    await task_service.delete_task(taskId, current_user)
 
     return None
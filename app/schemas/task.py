@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# ?sort= for GET /lists/{listId}/tasks (see TaskService.get_tasks_by_list)
+TaskSort = Literal["created_at", "updated_at", "description"]
 
 
 class TaskCreate(BaseModel):
@@ -36,3 +39,20 @@ class TaskResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TaskBulkSelection(BaseModel):
+    ids: Optional[List[str]] = Field(
+        None, description="ID tugas dalam daftar yang akan diubah", example=["taskA1"]
+    )
+    all: bool = Field(False, description="Ubah semua tugas dalam daftar", example=False)
+
+    @model_validator(mode="after")
+    def validate_selection(self):
+        if self.all == (self.ids is not None):
+            raise ValueError("Provide either ids or all=true")
+        return self
+
+
+class TaskBulkResult(BaseModel):
+    count: int = Field(..., description="Jumlah tugas yang terpengaruh", example=3)
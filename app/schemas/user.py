@@ -63,6 +63,13 @@ class Token(BaseModel):
     token: str = Field(..., description="Bearer token untuk autentikasi")
     token_type: str = Field(default="bearer", description="Tipe token")
     expires_in: int = Field(..., description="Token expiration time in minutes")
+    refresh_token: Optional[str] = Field(
+        None, description="Refresh token untuk mendapatkan bearer token baru"
+    )
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(..., description="Refresh token dari login/refresh")
 
 
 class RegisterResponse(BaseModel):
@@ -0,0 +1,34 @@
+from typing import Any, Callable, Type
+
+from app.database import AnySession, run_db
+
+
+class AsyncServiceAdapter:
+    """
+    Async facade over a sync service class.
+
+    Every public method of `service_class` becomes awaitable. The call runs
+    against either session type: through AsyncSession.run_sync in async
+    database mode, or in the threadpool with a regular Session. The sync
+    service stays the single implementation of the query logic.
+    """
+
+    service_class: Type = None
+
+    def __init__(self, db: AnySession):
+        self.db = db
+
+    async def _call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        def call(session):
+            return getattr(self.service_class(session), name)(*args, **kwargs)
+
+        return await run_db(self.db, call)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not hasattr(self.service_class, name):
+            raise AttributeError(name)
+
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self._call(name, *args, **kwargs)
+
+        return method
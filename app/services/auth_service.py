@@ -2,11 +2,18 @@ import re
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.utils.security import generate_id, get_password_hash, verify_password
+from app.services.async_adapter import AsyncServiceAdapter
+from app.utils.hashing import password_hasher
+from app.utils.security import (
+    generate_id,
+    get_password_hash,
+    verify_and_update_password,
+)
 
 
 class AuthService:
@@ -16,31 +23,20 @@ class AuthService:
     def create_user(self, user_data: UserCreate) -> User:
         """
         Membuat user baru dengan email dan password
-        """
-        # Check if email already exists
-        db_user = self.db.query(User).filter(User.email == user_data.email).first()
-        if db_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-
-        # Check if username already exists (if provided)
-        if user_data.username:
-            db_user_username = (
-                self.db.query(User).filter(User.username == user_data.username).first()
-            )
-            if db_user_username:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already exists",
-                )
 
+        Keunikan email/username dijamin oleh unique constraint di database,
+        sehingga tidak ada SELECT pengecekan sebelum INSERT.
+        """
         # Validate password complexity
         self._validate_password_complexity(user_data.password)
 
-        # Create new user
         hashed_password = get_password_hash(user_data.password)
+        return self._insert_user(user_data, hashed_password)
+
+    def _insert_user(self, user_data: UserCreate, hashed_password: str) -> User:
+        """
+        Menyimpan user baru; created_at dikembalikan lewat INSERT ... RETURNING
+        """
         db_user = User(
             id=generate_id(),
             username=user_data.username,
@@ -49,11 +45,30 @@ class AuthService:
         )
 
         self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
+        try:
+            self.db.commit()
+        except IntegrityError as exc:
+            self.db.rollback()
+            raise self._duplicate_user_error(exc) from exc
 
         return db_user
 
+    @staticmethod
+    def _duplicate_user_error(exc: IntegrityError) -> HTTPException:
+        """
+        Memetakan pelanggaran unique constraint ke pesan error yang sudah ada
+        """
+        message = str(exc.orig)
+        if any(
+            marker in message
+            for marker in ("users.username", "ix_users_username", "(username)")
+        ):
+            detail = "Username already exists"
+        else:
+            detail = "Email already registered"
+
+        return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
     def authenticate_user_email(self, email: str, password: str) -> Optional[User]:
         """
         Autentikasi user berdasarkan email dan password
@@ -61,8 +76,11 @@ class AuthService:
         user = self.db.query(User).filter(User.email == email).first()
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            self._rehash_password(user, new_hash)
         return user
 
     def authenticate_user_username(
@@ -74,10 +92,20 @@ class AuthService:
         user = self.db.query(User).filter(User.username == username).first()
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
             return None
+        if new_hash:
+            self._rehash_password(user, new_hash)
         return user
 
+    def _rehash_password(self, user: User, new_hash: str) -> None:
+        """
+        Menyimpan hash baru setelah login sukses (skema/cost hash sudah berubah)
+        """
+        user.hashed_password = new_hash
+        self.db.commit()
+
     def get_user_by_username(self, username: str) -> Optional[User]:
         """
         Mendapatkan user berdasarkan username
@@ -96,7 +124,8 @@ class AuthService:
         """
         return self.db.query(User).filter(User.id == user_id).first()
 
-    def _validate_password_complexity(self, password: str) -> None:
+    @staticmethod
+    def _validate_password_complexity(password: str) -> None:
         """
         Validasi kompleksitas password
         """
@@ -124,3 +153,53 @@ class AuthService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Password must contain at least one special character",
             )
+
+
+class AsyncAuthService(AsyncServiceAdapter):
+    """
+    Versi async AuthService; hashing dan verifikasi password dijalankan di
+    password executor, bukan di event loop maupun threadpool
+    """
+
+    service_class = AuthService
+
+    async def create_user(self, user_data: UserCreate) -> User:
+        """
+        Membuat user baru; koneksi database baru diambil setelah hashing
+        password selesai agar tidak tertahan selama hashing
+        """
+        # Validate password complexity
+        AuthService._validate_password_complexity(user_data.password)
+
+        hashed_password = await password_hasher.hash(user_data.password)
+        return await self._call("_insert_user", user_data, hashed_password)
+
+    async def authenticate_user_email(
+        self, email: str, password: str
+    ) -> Optional[User]:
+        """
+        Autentikasi user berdasarkan email dan password
+        """
+        user = await self._call("get_user_by_email", email)
+        return await self._verify(user, password)
+
+    async def authenticate_user_username(
+        self, username: str, password: str
+    ) -> Optional[User]:
+        """
+        Autentikasi user berdasarkan username dan password (backward compatibility)
+        """
+        user = await self._call("get_user_by_username", username)
+        return await self._verify(user, password)
+
+    async def _verify(self, user: Optional[User], password: str) -> Optional[User]:
+        if not user:
+            return None
+        verified, new_hash = await password_hasher.verify_and_update(
+            password, user.hashed_password
+        )
+        if not verified:
+            return None
+        if new_hash:
+            await self._call("_rehash_password", user, new_hash)
+        return user
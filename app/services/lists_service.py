@@ -1,14 +1,21 @@
-from typing import List as ListType
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
 from app.models.list import List
 from app.models.user import User
 from app.schemas.list import ListCreate, ListUpdate
+from app.services.async_adapter import AsyncServiceAdapter
+from app.utils.pagination import Page, SortKey, after_cursor, page_limit, to_page
 from app.utils.security import generate_id
 
+# Lists page in creation order
+LIST_ORDER = SortKey(
+    "created_at", List.created_at, lambda row: row.created_at, temporal=True
+)
+
 
 class ListService:
     def __init__(self, db: Session):
@@ -20,17 +27,27 @@ class ListService:
         """
         db_list = List(id=generate_id(), name=list_data.name, user_id=user.id)
 
+        # created_at comes back through INSERT ... RETURNING; no refresh needed
         self.db.add(db_list)
         self.db.commit()
-        self.db.refresh(db_list)
 
         return db_list
 
-    def get_user_lists(self, user: User) -> ListType[List]:
+    def get_user_lists(
+        self, user: User, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page[List]:
         """
-        Mendapatkan semua list milik user
+        Mendapatkan satu halaman list milik user, urut (created_at, id)
         """
-        return self.db.query(List).filter(List.user_id == user.id).all()
+        limit = page_limit(limit)
+        query = select(List).where(List.user_id == user.id)
+        if cursor:
+            query = query.where(after_cursor(LIST_ORDER, List.id, cursor))
+
+        rows = self.db.scalars(
+            query.order_by(LIST_ORDER.expression, List.id).limit(limit + 1)
+        ).all()
+        return to_page(rows, limit, LIST_ORDER)
 
     def get_list_by_id(self, list_id: str, user: User) -> Optional[List]:
         """
@@ -44,32 +61,47 @@ class ListService:
 
     def update_list(self, list_id: str, list_data: ListUpdate, user: User) -> List:
         """
-        Update list berdasarkan ID
+        Update list berdasarkan ID dengan satu UPDATE ... RETURNING yang
+        sekaligus memeriksa kepemilikan
         """
-        db_list = self.get_list_by_id(list_id, user)
+        db_list = self.db.scalars(
+            update(List)
+            .where(List.id == list_id, List.user_id == user.id)
+            .values(name=list_data.name)
+            .returning(List)
+        ).first()
+
         if not db_list:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
             )
 
-        db_list.name = list_data.name
-
         self.db.commit()
-        self.db.refresh(db_list)
-
         return db_list
 
     def delete_list(self, list_id: str, user: User) -> bool:
         """
-        Hapus list berdasarkan ID (beserta semua tasks di dalamnya)
+        Hapus list berdasarkan ID dengan satu DELETE ... RETURNING; tasks di
+        dalamnya dihapus database lewat ON DELETE CASCADE
         """
-        db_list = self.get_list_by_id(list_id, user)
-        if not db_list:
+        deleted = self.db.scalars(
+            delete(List)
+            .where(List.id == list_id, List.user_id == user.id)
+            .returning(List.id)
+        ).first()
+
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
             )
 
-        self.db.delete(db_list)
         self.db.commit()
-
         return True
+
+
+class AsyncListService(AsyncServiceAdapter):
+    """
+    Versi async ListService untuk route async (lihat AsyncServiceAdapter)
+    """
+
+    service_class = ListService
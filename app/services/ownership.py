@@ -0,0 +1,49 @@
+from sqlalchemy import Select, and_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.list import List
+from app.models.task import Task
+
+
+def owned_list_ids(user_id: str) -> Select:
+    """
+    Subquery: ID semua list milik user
+    """
+    return select(List.id).where(List.user_id == user_id)
+
+
+def task_is_owned(user_id: str) -> ColumnElement[bool]:
+    """
+    Kondisi WHERE untuk task yang berada di list milik user; dipakai
+    langsung di SELECT, UPDATE dan DELETE sehingga cek akses dan operasi
+    berjalan dalam satu statement
+    """
+    return Task.list_id.in_(owned_list_ids(user_id))
+
+
+def owned_task(task_id: str, user_id: str) -> Select:
+    """
+    SELECT satu task beserta cek kepemilikan (JOIN ke lists)
+    """
+    return (
+        select(Task)
+        .join(List, Task.list_id == List.id)
+        .where(Task.id == task_id, List.user_id == user_id)
+    )
+
+
+def owned_list_tasks(
+    list_id: str, user_id: str, *conditions: ColumnElement[bool]
+) -> Select:
+    """
+    SELECT task dalam list milik user. LEFT JOIN dari lists: tidak ada baris
+    berarti list tidak ditemukan, satu baris None berarti tidak ada task
+    (yang cocok). Kondisi tambahan pada task masuk ke ON, bukan WHERE, agar
+    baris list tetap muncul
+    """
+    return (
+        select(Task)
+        .select_from(List)
+        .outerjoin(Task, and_(Task.list_id == List.id, *conditions))
+        .where(List.id == list_id, List.user_id == user_id)
+    )
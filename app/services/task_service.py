@@ -1,15 +1,39 @@
+from datetime import datetime
 from typing import List as ListType
 from typing import Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import delete, func, insert, literal, select, update
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models.list import List
 from app.models.task import Task
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskBulkSelection, TaskCreate, TaskUpdate
+from app.services.async_adapter import AsyncServiceAdapter
+from app.services.ownership import owned_list_tasks, owned_task, task_is_owned
+from app.utils.pagination import Page, SortKey, after_cursor, page_limit, to_page
 from app.utils.security import generate_id
 
+# ?sort= values for task listings; each has an index ending in (key, id).
+# updated_at is the last modification, i.e. created_at until first updated.
+TASK_SORT_KEYS = {
+    key.name: key
+    for key in (
+        SortKey(
+            "created_at", Task.created_at, lambda row: row.created_at, temporal=True
+        ),
+        SortKey(
+            "updated_at",
+            func.coalesce(Task.updated_at, Task.created_at),
+            lambda row: row.updated_at or row.created_at,
+            temporal=True,
+        ),
+        SortKey("description", Task.description, lambda row: row.description),
+    )
+}
+
 
 class TaskService:
     def __init__(self, db: Session):
@@ -17,104 +41,266 @@ class TaskService:
 
     def create_task(self, list_id: str, task_data: TaskCreate, user: User) -> Task:
         """
-        Membuat task baru dalam list
+        Membuat task baru dalam list dengan satu INSERT ... SELECT ... RETURNING;
+        SELECT dari lists sekaligus memastikan list milik user
         """
-        # Verify list exists and belongs to user
-        db_list = (
-            self.db.query(List)
-            .filter(List.id == list_id, List.user_id == user.id)
-            .first()
-        )
+        db_task = self.db.scalars(
+            insert(Task)
+            .from_select(
+                ["id", "list_id", "description", "completed"],
+                select(
+                    literal(generate_id(), Task.id.type),
+                    List.id,
+                    literal(task_data.description, Task.description.type),
+                    literal(task_data.completed or False, Task.completed.type),
+                ).where(List.id == list_id, List.user_id == user.id),
+            )
+            .returning(Task)
+        ).first()
 
-        if not db_list:
+        if not db_task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
             )
 
-        db_task = Task(
-            id=generate_id(),
-            list_id=list_id,
-            description=task_data.description,
-            completed=task_data.completed or False,
-        )
-
-        self.db.add(db_task)
         self.db.commit()
-        self.db.refresh(db_task)
-
         return db_task
 
-    def get_tasks_by_list(self, list_id: str, user: User) -> ListType[Task]:
+    def create_tasks(
+        self, list_id: str, tasks_data: ListType[TaskCreate], user: User
+    ) -> ListType[Task]:
         """
-        Mendapatkan semua task dalam list
+        Membuat banyak task sekaligus: satu cek kepemilikan list lalu satu
+        INSERT multi-baris ... RETURNING dalam satu transaksi
         """
-        # Verify list belongs to user
-        db_list = (
-            self.db.query(List)
-            .filter(List.id == list_id, List.user_id == user.id)
-            .first()
-        )
+        if len(tasks_data) > settings.task_batch_max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.task_batch_max_size} tasks per batch",
+            )
+
+        self._ensure_list_owned(list_id, user)
+
+        if not tasks_data:
+            return []
 
-        if not db_list:
+        db_tasks = self.db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True),
+            [
+                {
+                    "id": generate_id(),
+                    "list_id": list_id,
+                    "description": task_data.description,
+                    "completed": task_data.completed or False,
+                }
+                for task_data in tasks_data
+            ],
+        ).all()
+
+        self.db.commit()
+        return db_tasks
+
+    def get_tasks_by_list(
+        self,
+        list_id: str,
+        user: User,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        completed: Optional[bool] = None,
+        created_after: Optional[datetime] = None,
+        updated_after: Optional[datetime] = None,
+        sort: str = "created_at",
+    ) -> Page[Task]:
+        """
+        Mendapatkan satu halaman task dalam list dengan filter dan urutan
+        dijalankan di SQL (cek kepemilikan dalam query yang sama)
+        """
+        key = TASK_SORT_KEYS.get(sort)
+        if key is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown sort: {sort}",
+            )
+
+        limit = page_limit(limit)
+        conditions = []
+        if completed is not None:
+            conditions.append(Task.completed == completed)
+        if created_after is not None:
+            conditions.append(Task.created_at > created_after)
+        if updated_after is not None:
+            conditions.append(TASK_SORT_KEYS["updated_at"].expression > updated_after)
+        if cursor:
+            conditions.append(after_cursor(key, Task.id, cursor))
+
+        rows = self.db.scalars(
+            owned_list_tasks(list_id, user.id, *conditions)
+            .order_by(key.expression, Task.id)
+            .limit(limit + 1)
+        ).all()
+
+        if not rows:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
             )
 
-        return self.db.query(Task).filter(Task.list_id == list_id).all()
+        return to_page([task for task in rows if task is not None], limit, key)
 
     def get_task_by_id(self, task_id: str, user: User) -> Optional[Task]:
         """
         Mendapatkan task berdasarkan ID dan memastikan user memiliki akses
         """
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        if not task:
-            return None
-
-        # Verify user owns the list that contains this task
-        db_list = (
-            self.db.query(List)
-            .filter(List.id == task.list_id, List.user_id == user.id)
-            .first()
-        )
-
-        if not db_list:
-            return None
-
-        return task
+        return self.db.scalars(owned_task(task_id, user.id)).first()
 
     def update_task(
         self, task_id: str, task_data: TaskUpdate, user: User
     ) -> Optional[Task]:
         """
-        Update task berdasarkan ID
+        Update task berdasarkan ID dengan satu UPDATE ... RETURNING yang
+        sekaligus memeriksa kepemilikan
         """
-        db_task = self.get_task_by_id(task_id, user)
+        values = {}
+        if task_data.description is not None:
+            values["description"] = task_data.description
+        if task_data.completed is not None:
+            values["completed"] = task_data.completed
+
+        if values:
+            db_task = self.db.scalars(
+                update(Task)
+                .where(Task.id == task_id, task_is_owned(user.id))
+                .values(**values)
+                .returning(Task)
+            ).first()
+            self.db.commit()
+        else:
+            db_task = self.get_task_by_id(task_id, user)
+
         if not db_task:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
             )
 
-        if task_data.description is not None:
-            db_task.description = task_data.description
-        if task_data.completed is not None:
-            db_task.completed = task_data.completed
+        return db_task
+
+    def set_task_completed(self, task_id: str, completed: bool, user: User) -> Task:
+        """
+        Tandai task selesai/belum selesai (satu UPDATE ... RETURNING)
+        """
+        return self.update_task(task_id, TaskUpdate(completed=completed), user)
+
+    def set_tasks_completed(
+        self, list_id: str, selection: TaskBulkSelection, completed: bool, user: User
+    ) -> int:
+        """
+        Tandai banyak task dalam list sekaligus dengan satu UPDATE berbasis
+        himpunan; kepemilikan dicek di dalam statement yang sama. Task yang
+        statusnya sudah sesuai tidak ditulis ulang. Mengembalikan jumlah task
+        yang berubah
+        """
+        if (
+            selection.ids is not None
+            and len(selection.ids) > settings.task_batch_max_size
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.task_batch_max_size} tasks per batch",
+            )
+
+        statement = update(Task).where(
+            Task.list_id == list_id,
+            task_is_owned(user.id),
+            Task.completed.is_not(completed),
+        )
+        if selection.ids is not None:
+            statement = statement.where(Task.id.in_(selection.ids))
+
+        result = self.db.execute(
+            statement.values(completed=completed),
+            execution_options={"synchronize_session": False},
+        )
+
+        if result.rowcount == 0:
+            # Nothing changed: only now pay a query to tell 404 from a no-op
+            self._ensure_list_owned(list_id, user)
+            return 0
 
         self.db.commit()
-        self.db.refresh(db_task)
+        return result.rowcount
 
-        return db_task
+    def delete_tasks(
+        self,
+        list_id: str,
+        user: User,
+        ids: Optional[ListType[str]] = None,
+        completed: Optional[bool] = None,
+        all: bool = False,
+    ) -> int:
+        """
+        Hapus banyak task dalam list dengan satu DELETE yang sekaligus
+        memeriksa kepemilikan; dibatasi ke ids dan/atau status completed, atau
+        semua task hanya bila all=True. Mengembalikan jumlah task yang terhapus
+        """
+        if ids is None and completed is None and not all:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Provide ids, completed or all=true",
+            )
+        if ids is not None and len(ids) > settings.task_batch_max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {settings.task_batch_max_size} tasks per batch",
+            )
+
+        statement = delete(Task).where(Task.list_id == list_id, task_is_owned(user.id))
+        if ids is not None:
+            statement = statement.where(Task.id.in_(ids))
+        if completed is not None:
+            statement = statement.where(Task.completed == completed)
+
+        result = self.db.execute(
+            statement, execution_options={"synchronize_session": False}
+        )
+
+        if result.rowcount == 0:
+            self._ensure_list_owned(list_id, user)
+            return 0
+
+        self.db.commit()
+        return result.rowcount
+
+    def _ensure_list_owned(self, list_id: str, user: User) -> None:
+        owned = self.db.scalar(
+            select(List.id).where(List.id == list_id, List.user_id == user.id)
+        )
+        if not owned:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="List not found"
+            )
 
     def delete_task(self, task_id: str, user: User) -> bool:
         """
-        Hapus task berdasarkan ID
+        Hapus task berdasarkan ID dengan satu DELETE yang sekaligus memeriksa
+        kepemilikan
         """
-        db_task = self.get_task_by_id(task_id, user)
-        if not db_task:
+        deleted = self.db.scalars(
+            delete(Task)
+            .where(Task.id == task_id, task_is_owned(user.id))
+            .returning(Task.id)
+        ).first()
+
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
             )
 
-        self.db.delete(db_task)
         self.db.commit()
-
         return True
+
+
+class AsyncTaskService(AsyncServiceAdapter):
+    """
+    Versi async TaskService untuk route async (lihat AsyncServiceAdapter)
+    """
+
+    service_class = TaskService
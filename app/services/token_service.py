@@ -0,0 +1,113 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.refresh_token import RefreshToken
+from app.services.async_adapter import AsyncServiceAdapter
+from app.utils.auth_cache import load_principal
+from app.utils.security import generate_id
+
+
+def hash_refresh_token(token: str) -> str:
+    """Hash a refresh token for storage (tokens are random, so SHA-256 is enough)"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class TokenService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def issue_refresh_token(self, user_id: str, family_id: Optional[str] = None) -> str:
+        """
+        Membuat refresh token baru; hanya hash-nya yang disimpan
+        """
+        token = secrets.token_urlsafe(48)
+        self.db.add(
+            RefreshToken(
+                id=generate_id(),
+                user_id=user_id,
+                family_id=family_id or generate_id(),
+                token_hash=hash_refresh_token(token),
+                expires_at=datetime.utcnow()
+                + timedelta(days=settings.refresh_token_expire_days),
+            )
+        )
+        self.db.commit()
+
+        return token
+
+    def rotate_refresh_token(self, token: str) -> Tuple[str, str]:
+        """
+        Menukar refresh token dengan yang baru dan mengembalikan (user_id, token baru)
+
+        Token yang sudah pernah dipakai menandakan pencurian token, sehingga
+        seluruh family token tersebut dicabut.
+        """
+        db_token = (
+            self.db.query(RefreshToken)
+            .filter(RefreshToken.token_hash == hash_refresh_token(token))
+            .first()
+        )
+        if not db_token:
+            raise self._invalid("Invalid refresh token")
+
+        # Mark as used atomically so concurrent refreshes cannot both succeed
+        claimed = self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == db_token.id, RefreshToken.revoked.is_(False))
+            .values(revoked=True)
+        ).rowcount
+        if not claimed:
+            self.revoke_family(db_token.family_id)
+            raise self._invalid("Refresh token has already been used")
+
+        if _as_naive_utc(db_token.expires_at) <= datetime.utcnow():
+            self.db.commit()
+            raise self._invalid("Refresh token has expired")
+
+        principal = load_principal(self.db, db_token.user_id)
+        if principal is None or not principal.is_active:
+            self.revoke_family(db_token.family_id)
+            raise self._invalid("Invalid refresh token")
+
+        new_token = self.issue_refresh_token(db_token.user_id, db_token.family_id)
+        return db_token.user_id, new_token
+
+    def revoke_family(self, family_id: str) -> None:
+        """
+        Mencabut semua refresh token dalam satu family
+        """
+        self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id)
+            .values(revoked=True)
+        )
+        self.db.commit()
+
+    @staticmethod
+    def _invalid(detail: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+class AsyncTokenService(AsyncServiceAdapter):
+    """
+    Versi async TokenService untuk route async (lihat AsyncServiceAdapter)
+    """
+
+    service_class = TokenService
@@ -0,0 +1,149 @@
+import hashlib
+import hmac
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user import User
+from app.utils.cache import TTLCache
+from app.utils.security import token_cache
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The subset of a user row that authentication and authorization need"""
+
+    id: str
+    email: str
+    username: Optional[str]
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            is_active=bool(user.is_active),
+        )
+
+
+class CredentialCache:
+    """
+    Cache of successful Basic auth verifications.
+
+    Keys are an HMAC of email and password, so neither the plaintext password
+    nor a cheaply reversible digest of it is kept in memory. Values hold the
+    user id and the password hash that was verified, which lets callers
+    reject an entry whose hash no longer matches the database row.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(email: str, password: str) -> bytes:
+        message = f"{email}\x00{password}".encode()
+        return hmac.new(settings.secret_key.encode(), message, hashlib.sha256).digest()
+
+    def get(self, email: str, password: str) -> Optional[tuple]:
+        """Return (user_id, hashed_password) for verified credentials"""
+        return self._cache.get(self._key(email, password))
+
+    def set(self, email: str, password: str, user: User) -> None:
+        """Remember that the credentials were verified for user"""
+        self._cache.set(self._key(email, password), (user.id, user.hashed_password))
+
+    def discard(self, email: str, password: str) -> None:
+        """Forget a single set of credentials"""
+        self._cache.pop(self._key(email, password))
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget every cached verification for user_id"""
+        self._cache.remove_where(lambda key, value: value[0] == user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+credential_cache = CredentialCache(
+    maxsize=settings.basic_auth_cache_size,
+    ttl=settings.basic_auth_cache_ttl_seconds,
+)
+
+principal_cache = TTLCache(
+    maxsize=settings.principal_cache_size,
+    ttl=settings.principal_cache_ttl_seconds,
+)
+
+
+def load_principal(db: Session, user_id: str) -> Optional[Principal]:
+    """Return the principal for user_id, querying the database on a cache miss"""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        return None
+
+    principal = Principal.from_user(user)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop every cached auth entry for user_id; call after modifying a user"""
+    principal_cache.pop(user_id)
+    credential_cache.invalidate_user(user_id)
+
+
+def clear_auth_caches() -> None:
+    principal_cache.clear()
+    credential_cache.clear()
+    token_cache.clear()
+
+
+def _schedule_eviction(target: User, credentials: bool) -> None:
+    """
+    Record target for eviction once its session commits. Evicting during the
+    flush would let a concurrent request re-cache the row it still sees.
+    """
+    session = inspect(target).session
+    pending = session.info.setdefault("auth_evict", {})
+    pending[target.id] = pending.get(target.id, False) or credentials
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_update(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    _schedule_eviction(
+        target,
+        credentials=state.attrs.hashed_password.history.has_changes()
+        or state.attrs.is_active.history.has_changes()
+        or state.attrs.email.history.has_changes(),
+    )
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_on_delete(mapper, connection, target: User) -> None:
+    _schedule_eviction(target, credentials=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_users(session) -> None:
+    for user_id, credentials in session.info.pop("auth_evict", {}).items():
+        if credentials:
+            credential_cache.invalidate_user(user_id)
+        principal_cache.pop(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_pending_evictions(session) -> None:
+    session.info.pop("auth_evict", None)
@@ -1,5 +1,4 @@
-import base64
-from typing import Optional, Union
+from typing import Optional
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import (
@@ -8,12 +7,23 @@ from fastapi.security import (
     HTTPBasicCredentials,
     HTTPBearer,
 )
-from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models.user import User
-from app.services.auth_service import AuthService
-from app.utils.security import verify_password, verify_token
+from app.database import (
+    AnySession,
+    get_db,
+    get_replica_db,
+    is_pinned_to_primary,
+    run_db,
+)
+from app.services.auth_service import AsyncAuthService
+from app.utils.auth_cache import (
+    Principal,
+    credential_cache,
+    load_principal,
+    principal_cache,
+)
+from app.utils.rate_limit import client_ip, rate_limiter
+from app.utils.security import verify_token
 
 # HTTP Bearer token scheme
 security_bearer = HTTPBearer(auto_error=False)
@@ -21,60 +31,112 @@ security_bearer = HTTPBearer(auto_error=False)
 security_basic = HTTPBasic(auto_error=False)
 
 
-def get_current_user_bearer(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_bearer),
-    db: Session = Depends(get_db),
-) -> Optional[User]:
-    """
-    Dependency untuk mendapatkan user berdasarkan Bearer token
-    """
-    if not credentials:
-        return None
-
-    token = credentials.credentials
+async def _principal_from_token(token: str, db: AnySession) -> Optional[Principal]:
+    """Resolve an active principal from a Bearer token"""
     user_id = verify_token(token)
 
     if user_id is None:
         return None
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # Cached principals need no database round trip at all
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        principal = await run_db(db, load_principal, user_id)
+
+    if principal is None or not principal.is_active:
+        return None
+
+    return principal
+
+
+async def _principal_from_basic(
+    email: str, password: str, db: AnySession, ip: Optional[str] = None
+) -> Optional[Principal]:
+    """Resolve an active principal from email/password credentials"""
+    auth_service = AsyncAuthService(db)
+
+    # Skip the bcrypt verify when these exact credentials were verified recently
+    cached = credential_cache.get(email, password)
+    if cached is not None:
+        user_id, hashed_password = cached
+        user = await auth_service.get_user_by_id(user_id)
+        if (
+            user is not None
+            and user.email == email
+            and user.hashed_password == hashed_password
+            and user.is_active
+        ):
+            return Principal.from_user(user)
+        credential_cache.discard(email, password)
+
+    # Only uncached credentials cost a password verify, so only they are limited
+    rate_limiter.check_login(ip, email)
+
+    user = await auth_service.authenticate_user_email(email, password)
+
     if user is None or not user.is_active:
         return None
 
-    return user
+    credential_cache.set(email, password, user)
+    principal = Principal.from_user(user)
+    principal_cache.set(user.id, principal)
+    return principal
 
 
-def get_current_user_basic(
-    credentials: Optional[HTTPBasicCredentials] = Depends(security_basic),
-    db: Session = Depends(get_db),
-) -> Optional[User]:
+async def get_current_user_bearer(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_bearer),
+    db: AnySession = Depends(get_db),
+) -> Optional[Principal]:
     """
-    Dependency untuk mendapatkan user berdasarkan email/password (Basic Auth)
+    Dependency untuk mendapatkan user berdasarkan Bearer token
     """
     if not credentials:
         return None
 
-    auth_service = AuthService(db)
-    user = auth_service.authenticate_user_email(
-        credentials.username, credentials.password
-    )
+    return await _principal_from_token(credentials.credentials, db)
 
-    if user is None or not user.is_active:
+
+async def get_current_user_basic(
+    request: Request,
+    credentials: Optional[HTTPBasicCredentials] = Depends(security_basic),
+    db: AnySession = Depends(get_db),
+) -> Optional[Principal]:
+    """
+    Dependency untuk mendapatkan user berdasarkan email/password (Basic Auth)
+    """
+    if not credentials:
         return None
 
-    return user
+    return await _principal_from_basic(
+        credentials.username, credentials.password, db, client_ip(request)
+    )
 
 
-def get_current_user_flexible(
-    bearer_user: Optional[User] = Depends(get_current_user_bearer),
-    basic_user: Optional[User] = Depends(get_current_user_basic),
-) -> User:
+async def get_current_user_flexible(
+    request: Request,
+    bearer: Optional[HTTPAuthorizationCredentials] = Depends(security_bearer),
+    basic: Optional[HTTPBasicCredentials] = Depends(security_basic),
+    db: AnySession = Depends(get_db),
+) -> Principal:
     """
     Dependency yang menerima autentikasi Bearer token atau Basic Auth (email/password)
+
+    Kedua skema tetap menjadi dependency agar tercantum di OpenAPI; hanya
+    skema yang ada di header yang diverifikasi. Hasilnya disimpan di
+    request.state.principal sehingga dependency lain dapat memakainya ulang.
     """
-    user = bearer_user or basic_user
+    principal = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
+
+    if bearer is not None:
+        principal = await _principal_from_token(bearer.credentials, db)
+    elif basic is not None:
+        principal = await _principal_from_basic(
+            basic.username, basic.password, db, client_ip(request)
+        )
 
-    if user is None:
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials. Please provide valid Bearer token or email/password.",
@@ -84,13 +146,16 @@ def get_current_user_flexible(
             },
         )
 
-    return user
+    request.state.principal = principal
+    # Lets commits on this session pin the user to the primary (read-your-writes)
+    db.info["user_id"] = principal.id
+    return principal
 
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security_bearer),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AnySession = Depends(get_db),
+) -> Principal:
     """
     Dependency untuk mendapatkan user yang sedang login berdasarkan JWT token (backward compatibility)
     """
@@ -104,7 +169,9 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = principal_cache.get(user_id)
+    if user is None:
+        user = await run_db(db, load_principal, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -117,15 +184,30 @@ def get_current_user(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
 
+    db.info["user_id"] = user.id
     return user
 
 
-def get_current_active_user(
-    current_user: User = Depends(get_current_user_flexible),
-) -> User:
+async def get_current_active_user(
+    current_user: Principal = Depends(get_current_user_flexible),
+) -> Principal:
     """
     Dependency untuk memastikan user aktif dengan flexible authentication
     """
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_read_db(
+    current_user: Principal = Depends(get_current_user_flexible),
+    db: AnySession = Depends(get_db),
+    replica_db: Optional[AnySession] = Depends(get_replica_db),
+) -> AnySession:
+    """
+    Dependency session untuk handler GET: replica bila tersedia, kecuali user
+    baru saja menulis dan masih dalam jendela read-your-writes
+    """
+    if replica_db is None or is_pinned_to_primary(current_user.id):
+        return db
+    return replica_db
@@ -0,0 +1,139 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.utils.security import (
+    get_password_hash,
+    load_password_backend,
+    verify_and_update_password,
+    verify_password,
+)
+
+# Workers never fork the threaded server process directly: a fork can leave
+# children stuck on locks held by other threads (logging, the DB pool)
+WORKER_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+class PasswordHashExecutor:
+    """
+    Runs password hashing and verification off the request threadpool.
+
+    bcrypt holds a thread for hundreds of milliseconds; running it on a
+    dedicated process pool lets login storms use every core without taking
+    the anyio worker threads that the list/task endpoints rely on. The number
+    of outstanding jobs is bounded, and callers past the bound get a 503.
+    """
+
+    def __init__(
+        self,
+        backend: str = "process",
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+    ):
+        if backend not in ("process", "thread"):
+            raise ValueError(f"Unknown password hash executor backend: {backend}")
+
+        self.backend = backend
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.peak_pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.backend == "process":
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix="password-hash",
+                        )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy, please retry later",
+                    headers={"Retry-After": "1"},
+                )
+            self.pending += 1
+            self.submitted += 1
+            self.peak_pending = max(self.peak_pending, self.pending)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+                self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password on the executor"""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash on the executor"""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify a password and return a replacement hash if it is outdated"""
+        return await self._run(
+            verify_and_update_password, plain_password, hashed_password
+        )
+
+    async def warmup(self) -> None:
+        """Start the workers and load the hashing backend in each of them"""
+        await asyncio.gather(
+            *(self._run(load_password_backend) for _ in range(self.max_workers))
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue-depth metrics"""
+        return {
+            "backend": self.backend,
+            "workers": self.max_workers,
+            "pending": self.pending,
+            "peak_pending": self.peak_pending,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; it is recreated on next use"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHashExecutor(
+    backend=settings.password_hash_executor,
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
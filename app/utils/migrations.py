@@ -0,0 +1,95 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from alembic import command, op
+from alembic.config import Config
+from sqlalchemy import ColumnElement, Table, create_engine, inspect, select, update
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Revision matching the schema that Base.metadata.create_all used to build
+# (users, lists, tasks); later revisions create what such databases lack
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(url: Optional[str] = None) -> Config:
+    """
+    Konfigurasi Alembic dari alembic.ini, dengan URL database opsional
+    """
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    if url:
+        # ConfigParser interpolation treats % specially (e.g. in passwords)
+        config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(url: Optional[str] = None, revision: str = "head") -> None:
+    """
+    Menjalankan migrasi Alembic sampai revision.
+
+    Database lama yang dibuat dengan create_all (tabel ada, alembic_version
+    belum) di-stamp pada baseline terlebih dahulu.
+    """
+    url = url or settings.database_url
+    config = alembic_config(url)
+
+    engine = create_engine(url, poolclass=NullPool)
+    try:
+        with engine.connect() as connection:
+            tables = set(inspect(connection).get_table_names())
+    finally:
+        engine.dispose()
+
+    if "alembic_version" not in tables and "users" in tables:
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+def backfill_in_batches(
+    table: Table,
+    values: Dict[str, Any],
+    where: Optional[ColumnElement] = None,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+) -> int:
+    """
+    Update rows of `table` from inside a migration, one short transaction
+    per batch.
+
+    Rows are walked in primary-key order (keyset, so every batch is an index
+    range scan) and each batch commits on its own, so no lock is held for
+    longer than one batch and an interrupted backfill simply resumes. `pause`
+    sleeps between batches to leave room for production traffic.
+
+    Returns the number of rows updated.
+    """
+    (key,) = table.primary_key.columns
+    updated = 0
+    last = None
+
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        while True:
+            query = select(key).order_by(key).limit(batch_size)
+            if where is not None:
+                query = query.where(where)
+            if last is not None:
+                query = query.where(key > last)
+
+            ids = connection.execute(query).scalars().all()
+            if not ids:
+                return updated
+
+            result = connection.execute(
+                update(table).where(key.in_(ids)).values(values)
+            )
+            updated += result.rowcount
+            last = ids[-1]
+            if pause:
+                time.sleep(pause)
@@ -0,0 +1,102 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of rows plus the cursor for the next one (None on the last)"""
+
+    items: List[T]
+    next_cursor: Optional[str]
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    A keyset ordering: rows are ordered by (expression, id). `value` reads
+    the key from a loaded row; `temporal` keys travel in cursors as ISO 8601
+    """
+
+    name: str
+    expression: ColumnElement
+    value: Callable[[Any], Any]
+    temporal: bool = False
+
+
+def page_limit(limit: Optional[int]) -> int:
+    """Requested page size, defaulted and capped by settings"""
+    return min(limit or settings.page_default_limit, settings.page_max_limit)
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+
+def encode_cursor(key: SortKey, value: Any, id: str) -> str:
+    """Opaque cursor for the position right after (value, id) in key order"""
+    if key.temporal:
+        value = value.isoformat()
+    raw = json.dumps([key.name, value, id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(key: SortKey, cursor: str) -> Tuple[Any, str]:
+    """
+    Inverse of encode_cursor; malformed cursors, and cursors issued for a
+    different sort, are a 400
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        name, value, id = json.loads(raw)
+        if key.temporal:
+            value = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+    # Non-temporal keys are text columns; anything else would reach the bind
+    if not key.temporal and not isinstance(value, str):
+        raise _invalid_cursor()
+    if name != key.name or not isinstance(id, str):
+        raise _invalid_cursor()
+    return value, id
+
+
+def after_cursor(key: SortKey, id: ColumnElement, cursor: str) -> ColumnElement[bool]:
+    """
+    Keyset condition (key, id) > cursor. Paired with an index ending in
+    (key, id), every page is a seek plus `limit` rows, however deep the
+    client pages
+    """
+    return tuple_(key.expression, id) > decode_cursor(key, cursor)
+
+
+def to_page(rows: List[T], limit: int, key: SortKey) -> Page[T]:
+    """Build a Page from up to limit + 1 rows ordered by (key, id)"""
+    if len(rows) <= limit:
+        return Page(items=rows, next_cursor=None)
+    items = rows[:limit]
+    last = items[-1]
+    return Page(items=items, next_cursor=encode_cursor(key, key.value(last), last.id))
+
+
+def set_next_page_headers(
+    request: Request, response: Response, next_cursor: Optional[str]
+) -> None:
+    """Advertise the next page via Link (RFC 8288) and X-Next-Cursor"""
+    if next_cursor is None:
+        return
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    response.headers["X-Next-Cursor"] = next_cursor
@@ -0,0 +1,161 @@
+import abc
+import importlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """A token bucket: `capacity` requests burst, refilled at `per_minute`"""
+
+    name: str
+    capacity: int
+    per_minute: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.per_minute / 60.0
+
+
+class RateLimitBackend(abc.ABC):
+    """
+    Storage for token buckets.
+
+    Subclass this to share buckets between workers (e.g. in Redis) and point
+    RATE_LIMIT_BACKEND at the subclass.
+    """
+
+    @abc.abstractmethod
+    def consume(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]:
+        """Take one token; return (allowed, seconds until a token is available)"""
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        """Forget every bucket"""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process token buckets with periodic eviction of idle buckets"""
+
+    def __init__(
+        self,
+        sweep_interval: float = 60.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.sweep_interval = sweep_interval
+        self._timer = timer
+        # key -> [tokens, updated_at, refill_per_second, capacity]
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = timer() + sweep_interval
+
+    def consume(self, key: str, rule: RateLimitRule) -> Tuple[bool, float]:
+        now = self._timer()
+        rate = rule.refill_per_second
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(rule.capacity), now, rate, float(rule.capacity)]
+                self._buckets[key] = bucket
+            else:
+                bucket[0] = min(rule.capacity, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return True, 0.0
+
+            retry_after = (1 - bucket[0]) / rate if rate > 0 else math.inf
+            return False, retry_after
+
+    def _sweep(self, now: float) -> None:
+        """Drop buckets that have refilled completely; they equal a new bucket"""
+        full = [
+            key
+            for key, (tokens, updated_at, rate, capacity) in self._buckets.items()
+            if tokens + (now - updated_at) * rate >= capacity
+        ]
+        for key in full:
+            del self._buckets[key]
+        self._next_sweep = now + self.sweep_interval
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _load_backend(path: str) -> RateLimitBackend:
+    module_name, _, class_name = path.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class RateLimiter:
+    """Rejects requests with 429 before any database or password work runs"""
+
+    def __init__(self, backend: RateLimitBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.login_ip = RateLimitRule(
+            "login-ip",
+            settings.rate_limit_login_ip_capacity,
+            settings.rate_limit_login_ip_per_minute,
+        )
+        self.login_account = RateLimitRule(
+            "login-account",
+            settings.rate_limit_login_account_capacity,
+            settings.rate_limit_login_account_per_minute,
+        )
+        self.register_ip = RateLimitRule(
+            "register-ip",
+            settings.rate_limit_register_ip_capacity,
+            settings.rate_limit_register_ip_per_minute,
+        )
+
+    def check(self, rule: RateLimitRule, key: str) -> None:
+        """Consume a token from the rule's bucket for key, or raise 429"""
+        if not self.enabled:
+            return
+
+        allowed, retry_after = self.backend.consume(f"{rule.name}:{key}", rule)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts, please try again later",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+
+    def check_login(self, client_ip: Optional[str], account: str) -> None:
+        """Limit credential checks per client IP and per account"""
+        self.check(self.login_ip, client_ip or "unknown")
+        self.check(self.login_account, account.lower())
+
+    def check_register(self, client_ip: Optional[str]) -> None:
+        """Limit registrations per client IP"""
+        self.check(self.register_ip, client_ip or "unknown")
+
+    def reset(self) -> None:
+        self.backend.reset()
+
+
+def client_ip(request: Request) -> Optional[str]:
+    """Return the client address of a request"""
+    return request.client.host if request.client else None
+
+
+rate_limiter = RateLimiter(
+    backend=_load_backend(settings.rate_limit_backend),
+    enabled=settings.rate_limit_enabled,
+)
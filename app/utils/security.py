@@ -1,14 +1,48 @@
-import uuid
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.ids import uuid7
+
+SUPPORTED_HASH_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_password_context() -> CryptContext:
+    """
+    Build the password hashing context from settings.
+
+    The configured scheme hashes new passwords; the other supported schemes are
+    kept for verification only and marked deprecated, so their hashes (and
+    hashes made with a different cost) report needs_update after login.
+    """
+    scheme = settings.password_hash_scheme
+    if scheme not in SUPPORTED_HASH_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme: {scheme}")
+
+    schemes = [scheme] + [s for s in SUPPORTED_HASH_SCHEMES if s != scheme]
+    return CryptContext(
+        schemes=schemes,
+        default=scheme,
+        deprecated="auto",
+        bcrypt__rounds=settings.bcrypt_rounds,
+        bcrypt__min_rounds=settings.bcrypt_rounds,
+        bcrypt__max_rounds=settings.bcrypt_rounds,
+        argon2__time_cost=settings.argon2_time_cost,
+        argon2__memory_cost=settings.argon2_memory_cost,
+        argon2__parallelism=settings.argon2_parallelism,
+    )
+
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_password_context()
+
+# Verified JWT -> (sub, exp), so repeated tokens skip signature checks
+token_cache = TTLCache(maxsize=settings.token_cache_size, ttl=0)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -21,6 +55,37 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also return a new hash when the old one is outdated"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def calibrate_password_hash(samples: int = 3) -> float:
+    """Return the average milliseconds needed to hash one password"""
+    start = time.perf_counter()
+    for _ in range(samples):
+        pwd_context.hash("calibration-Password-1!")
+    return (time.perf_counter() - start) / samples * 1000
+
+
+def load_password_backend() -> str:
+    """Load the hashing backend of the configured scheme and return its name"""
+    return pwd_context.handler().get_backend()
+
+
+def describe_password_hash() -> str:
+    """Describe the configured scheme and its cost parameters"""
+    if settings.password_hash_scheme == "argon2":
+        return (
+            f"argon2 (time_cost={settings.argon2_time_cost}, "
+            f"memory_cost={settings.argon2_memory_cost} KiB, "
+            f"parallelism={settings.argon2_parallelism})"
+        )
+    return f"bcrypt (rounds={settings.bcrypt_rounds})"
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -40,6 +105,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def verify_token(token: str) -> Optional[str]:
     """Verify JWT token and return user_id"""
+    cached = token_cache.get(token)
+    if cached is not None:
+        user_id, exp = cached
+        if exp > time.time():
+            return user_id
+        token_cache.pop(token)
+
     try:
         payload = jwt.decode(
             token, settings.secret_key, algorithms=[settings.algorithm]
@@ -47,11 +119,16 @@ def verify_token(token: str) -> Optional[str]:
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
-        return user_id
     except JWTError:
         return None
 
+    # Only tokens with an expiry are cached, and never past that expiry
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(token, (user_id, exp), ttl=exp - time.time())
+    return user_id
+
 
 def generate_id() -> str:
-    """Generate unique ID"""
-    return str(uuid.uuid4()).replace("-", "")
+    """Generate unique, time-ordered ID (32 hex characters, UUIDv7)"""
+    return uuid7().hex
@@ -0,0 +1,78 @@
+import time
+from typing import Dict, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from jose import jwt
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from app.config import settings
+from app.utils.hashing import password_hasher
+from app.utils.security import load_password_backend
+
+
+def warm_jwt() -> None:
+    """Sign and verify one token so jose loads its HMAC backend and key"""
+    token = jwt.encode(
+        {"sub": "warmup"}, settings.secret_key, algorithm=settings.algorithm
+    )
+    jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+
+
+def _pool_target(engine: Engine, connections: int) -> int:
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        return min(connections, pool.size())
+    return min(connections, 1)
+
+
+def warm_pool(engine: Engine, connections: int) -> int:
+    """Open up to `connections` pooled connections; return how many"""
+    target = _pool_target(engine, connections)
+    opened = [engine.connect() for _ in range(target)]
+    for connection in opened:
+        connection.close()
+    return target
+
+
+async def warm_async_pool(engine: AsyncEngine, connections: int) -> int:
+    """Open up to `connections` pooled connections on an async engine"""
+    target = _pool_target(engine.sync_engine, connections)
+    opened = [await engine.connect() for _ in range(target)]
+    for connection in opened:
+        await connection.close()
+    return target
+
+
+async def warmup(
+    engine: Engine, async_engine: Optional[AsyncEngine] = None
+) -> Dict[str, float]:
+    """
+    Pay the one-off costs of the first request before serving traffic:
+    the password hashing backend (here and in the hashing workers), the JWT
+    signing backend, and the first database connections.
+
+    Returns the milliseconds spent on each step.
+    """
+    timings: Dict[str, float] = {}
+
+    def timed(name: str, start: float) -> None:
+        timings[name] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    load_password_backend()
+    await password_hasher.warmup()
+    timed("password_hashing", start)
+
+    start = time.perf_counter()
+    warm_jwt()
+    timed("jwt", start)
+
+    start = time.perf_counter()
+    await run_in_threadpool(warm_pool, engine, settings.warmup_pool_connections)
+    if async_engine is not None:
+        await warm_async_pool(async_engine, settings.warmup_pool_connections)
+    timed("database_pool", start)
+
+    return timings
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark the authentication dependency used by get_current_active_user.
+
+Compares the previous fan-out (Bearer and Basic principals both resolved,
+each with its own database session, on every request) against the
+single-pass dependency that only verifies the scheme that was sent.
+
+Usage:
+    python benchmarks/bench_auth_dependency.py [--requests 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, get_db
+from app.models.list import List  # noqa: F401
+from app.models.task import Task  # noqa: F401
+from app.models.user import User
+from app.utils.auth_cache import Principal
+from app.utils.dependencies import (
+    get_current_active_user,
+    get_current_user_basic,
+    get_current_user_bearer,
+)
+from app.utils.security import create_access_token, generate_id, get_password_hash
+
+
+def fan_out_user(
+    bearer_user: Optional[Principal] = Depends(get_current_user_bearer),
+    basic_user: Optional[Principal] = Depends(get_current_user_basic),
+) -> Principal:
+    """The previous get_current_user_flexible: two dependency subtrees"""
+    user = bearer_user or basic_user
+    if user is None:
+        raise HTTPException(status_code=401)
+    return user
+
+
+def build_app(dependency) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping(current_user: Principal = Depends(dependency)):
+        return {"id": current_user.id}
+
+    return app
+
+
+def run(client: TestClient, headers: dict, requests: int) -> float:
+    for _ in range(50):
+        client.get("/ping", headers=headers)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get("/ping", headers=headers)
+        assert response.status_code == 200
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = SessionLocal()
+    user = User(
+        id=generate_id(),
+        email="bench@example.com",
+        hashed_password=get_password_hash("BenchPassword123!"),
+    )
+    db.add(user)
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+    db.close()
+
+    def override_get_db():
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    results = {}
+    for name, dependency in (
+        ("fan-out (bearer + basic)", fan_out_user),
+        ("single-pass", get_current_active_user),
+    ):
+        app = build_app(dependency)
+        app.dependency_overrides[get_db] = override_get_db
+        with TestClient(app) as client:
+            results[name] = run(client, headers, args.requests)
+
+    for name, per_request in results.items():
+        print(f"{name:<26} {per_request:8.1f} us/request")
+
+    saved = results["fan-out (bearer + basic)"] - results["single-pass"]
+    print(f"{'overhead removed':<26} {saved:8.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
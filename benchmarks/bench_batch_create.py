@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark creating tasks one request at a time against the batch endpoint.
+
+The loop calls POST /v1/lists/{listId}/tasks once per task, the way the
+importers did; the batch run sends the same tasks to
+POST /v1/lists/{listId}/tasks/batch in chunks of TASK_BATCH_MAX_SIZE.
+Requests go in-process through the ASGI transport against a fresh SQLite
+file, so the numbers reflect the app and its data path, not the network.
+
+Usage:
+    python benchmarks/bench_batch_create.py [--tasks 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+async def run(tasks: int) -> dict:
+    import httpx
+
+    from app.config import settings
+    from app.database import Base, engine
+    from app.main import app
+
+    Base.metadata.create_all(bind=engine)
+    user = {"email": "bench@example.com", "password": "BenchPassword123!"}
+    payload = [{"description": f"Imported task {i}"} for i in range(tasks)]
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.post("/v1/auth/register", json=user)
+        token = (await client.post("/v1/auth/login", json=user)).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async def new_list(name: str) -> str:
+            response = await client.post(
+                "/v1/lists/", json={"name": name}, headers=headers
+            )
+            return response.json()["id"]
+
+        list_id = await new_list("Loop")
+        start = time.perf_counter()
+        for item in payload:
+            response = await client.post(
+                f"/v1/lists/{list_id}/tasks", json=item, headers=headers
+            )
+            assert response.status_code == 201
+        results["loop"] = time.perf_counter() - start
+
+        list_id = await new_list("Batch")
+        size = settings.task_batch_max_size
+        start = time.perf_counter()
+        for offset in range(0, tasks, size):
+            response = await client.post(
+                f"/v1/lists/{list_id}/tasks/batch",
+                json=payload[offset : offset + size],
+                headers=headers,
+            )
+            assert response.status_code == 201
+        results["batch"] = time.perf_counter() - start
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+        os.environ.setdefault("BCRYPT_ROUNDS", "4")
+        results = asyncio.run(run(args.tasks))
+
+    print(f"{'mode':<6} {'seconds':>9} {'tasks/s':>9}")
+    for mode, elapsed in results.items():
+        print(f"{mode:<6} {elapsed:9.2f} {args.tasks / elapsed:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark clearing completed tasks from a large list.
+
+A list is seeded with --tasks tasks, half of them completed. The loop deletes
+--loop completed tasks one DELETE /v1/tasks/{taskId} call at a time and
+projects that rate over every completed task; the bulk run clears all of them
+with a single DELETE /v1/lists/{listId}/tasks?completed=true. Requests go
+in-process through the ASGI transport against a fresh SQLite file.
+
+Usage:
+    python benchmarks/bench_bulk_delete.py [--tasks 50000] [--loop 1000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+async def run(tasks: int, loop: int) -> dict:
+    import httpx
+    from sqlalchemy import insert, select
+
+    from app.database import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.task import Task
+    from app.utils.security import generate_id
+
+    Base.metadata.create_all(bind=engine)
+    user = {"email": "bench@example.com", "password": "BenchPassword123!"}
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.post("/v1/auth/register", json=user)
+        token = (await client.post("/v1/auth/login", json=user)).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        list_id = (
+            await client.post("/v1/lists/", json={"name": "Big"}, headers=headers)
+        ).json()["id"]
+
+        with SessionLocal() as db:
+            db.execute(
+                insert(Task),
+                [
+                    {
+                        "id": generate_id(),
+                        "list_id": list_id,
+                        "description": f"Task {i}",
+                        "completed": i % 2 == 0,
+                    }
+                    for i in range(tasks)
+                ],
+            )
+            db.commit()
+            done = db.scalars(
+                select(Task.id).where(Task.completed.is_(True)).limit(loop)
+            ).all()
+
+        start = time.perf_counter()
+        for task_id in done:
+            response = await client.delete(f"/v1/tasks/{task_id}", headers=headers)
+            assert response.status_code == 204
+        per_task = (time.perf_counter() - start) / len(done)
+        completed = (tasks + 1) // 2
+        remaining = completed - len(done)
+        results["loop (projected)"] = (per_task * completed, completed)
+
+        start = time.perf_counter()
+        response = await client.delete(
+            f"/v1/lists/{list_id}/tasks?completed=true", headers=headers
+        )
+        elapsed = time.perf_counter() - start
+        assert response.json()["count"] == remaining
+        results["bulk"] = (elapsed, remaining)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--loop", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+        os.environ.setdefault("BCRYPT_ROUNDS", "4")
+        results = asyncio.run(run(args.tasks, args.loop))
+
+    print(f"{'mode':<17} {'deleted':>8} {'seconds':>9}")
+    for mode, (elapsed, deleted) in results.items():
+        print(f"{mode:<17} {deleted:8d} {elapsed:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold starts: import time of app.main and time to first response.
+
+Each run starts a fresh interpreter. "import" is the time to import app.main;
+"first response" starts uvicorn and polls until GET /health answers, then
+times one registration (password hashing workers, bcrypt, a database
+connection), where lazy initialisation that the warmup skips would show up.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs 5] [--no-warmup] [--migrate]
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request(url: str, body: bytes = None) -> int:
+    req = urllib.request.Request(
+        url, data=body, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+
+
+def measure_import(env: dict) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_response(env: dict) -> tuple:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                if request(f"{base}/health") == 200:
+                    break
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup")
+            time.sleep(0.01)
+        ready = (time.perf_counter() - start) * 1000
+
+        body = json.dumps(
+            {"email": f"{uuid.uuid4().hex}@example.com", "password": "Password123!"}
+        ).encode()
+        first = time.perf_counter()
+        assert request(f"{base}/v1/auth/register", body) == 201
+        register_ms = (time.perf_counter() - first) * 1000
+        return ready, register_ms
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--no-warmup", action="store_true")
+    parser.add_argument("--migrate", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'cold.db')}",
+            MIGRATE_ON_STARTUP="true" if args.migrate else "false",
+            STARTUP_WARMUP="false" if args.no_warmup else "true",
+            PASSWORD_HASH_CALIBRATE_ON_STARTUP="false",
+        )
+        # The registration probe needs the schema even when the app does not migrate
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "alembic",
+                "-x",
+                f"url={env['DATABASE_URL']}",
+                "upgrade",
+                "head",
+            ],
+            cwd=ROOT,
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+
+        imports, ready, registers = [], [], []
+        for _ in range(args.runs):
+            imports.append(measure_import(env))
+            ready_ms, register_ms = measure_first_response(env)
+            ready.append(ready_ms)
+            registers.append(register_ms)
+
+    print(f"{'import app.main':<28} {statistics.median(imports):8.1f} ms")
+    print(f"{'process start -> /health':<28} {statistics.median(ready):8.1f} ms")
+    print(f"{'first register request':<28} {statistics.median(registers):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark list/task reads under concurrency in sync and async database modes.
+
+Each mode runs in its own interpreter (DATABASE_MODE is read at import time)
+against a fresh SQLite file. Requests are issued in-process through the ASGI
+transport so the numbers reflect the app and its data path, not the network.
+
+Usage:
+    python benchmarks/bench_database_modes.py [--requests 2000] [--concurrency 100]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+async def run_mode(requests: int, concurrency: int) -> dict:
+    import httpx
+
+    from app.main import app
+
+    user = {"email": "bench@example.com", "password": "BenchPassword123!"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.post("/v1/auth/register", json=user)
+        token = (await client.post("/v1/auth/login", json=user)).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        todo_list = (
+            await client.post("/v1/lists/", json={"name": "Bench"}, headers=headers)
+        ).json()
+        for i in range(20):
+            await client.post(
+                f"/v1/lists/{todo_list['id']}/tasks",
+                json={"description": f"Task {i}"},
+                headers=headers,
+            )
+
+        paths = ["/v1/lists/", f"/v1/lists/{todo_list['id']}/tasks"]
+        latencies = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(i: int):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(paths[i % 2], headers=headers)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = asyncio.run(run_mode(args.requests, args.concurrency))
+        print(json.dumps(result))
+        return
+
+    print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for mode in ("sync", "async"):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DATABASE_MODE=mode,
+                DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                RATE_LIMIT_ENABLED="false",
+                BCRYPT_ROUNDS="4",
+            )
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--child",
+                    f"--requests={args.requests}",
+                    f"--concurrency={args.concurrency}",
+                ],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<6} {result['throughput']:9.0f} "
+            f"{result['p50_ms']:9.1f} {result['p95_ms']:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
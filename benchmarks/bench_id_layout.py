@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark insert throughput and index size for the task key layouts.
+
+Compares random uuid4 hex strings (the previous generate_id), time-ordered
+UUIDv7 hex strings (the current generate_id) and UUIDv7 stored as 16-byte
+BLOBs (ID_STORAGE=binary). Each layout gets the tasks table with its
+primary key and the composite indexes from the models, filled in batched
+transactions with the app's SQLite pragmas. Sizes come from SQLite's dbstat.
+
+Usage:
+    python benchmarks/bench_id_layout.py [--rows 10000000] [--lists 100000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import sqlite_pragmas
+from app.utils.ids import uuid7
+
+LAYOUTS = {
+    "uuid4 hex": ("VARCHAR", lambda: uuid.uuid4().hex),
+    "uuid7 hex": ("VARCHAR", lambda: uuid7().hex),
+    "uuid7 binary": ("BLOB", lambda: uuid7().bytes),
+}
+
+SCHEMA = """
+CREATE TABLE tasks (
+    id {key} NOT NULL PRIMARY KEY,
+    list_id {key} NOT NULL,
+    description VARCHAR NOT NULL,
+    completed BOOLEAN,
+    created_at DATETIME DEFAULT (CURRENT_TIMESTAMP)
+);
+CREATE INDEX ix_tasks_list_id_completed_created_at
+    ON tasks (list_id, completed, created_at);
+CREATE INDEX ix_tasks_list_id_id ON tasks (list_id, id);
+"""
+
+
+def run(path: str, key_type: str, new_id, rows: int, lists: int, batch: int):
+    connection = sqlite3.connect(path)
+    for statement in sqlite_pragmas():
+        connection.execute(statement)
+    connection.executescript(SCHEMA.format(key=key_type))
+
+    list_ids = [new_id() for _ in range(lists)]
+    insert = (
+        "INSERT INTO tasks (id, list_id, description, completed) VALUES (?, ?, ?, 0)"
+    )
+
+    start = time.perf_counter()
+    last_rate = 0.0
+    for offset in range(0, rows, batch):
+        size = min(batch, rows - offset)
+        batch_start = time.perf_counter()
+        connection.executemany(
+            insert,
+            ((new_id(), random.choice(list_ids), "task") for _ in range(size)),
+        )
+        connection.commit()
+        last_rate = size / (time.perf_counter() - batch_start)
+    elapsed = time.perf_counter() - start
+
+    sizes = dict(
+        connection.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+    )
+    connection.close()
+    return rows / elapsed, last_rate, sizes
+
+
+def mib(size: int) -> str:
+    return f"{size / 2**20:9.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--lists", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'layout':<13} {'rows/s':>9} {'last batch':>11} "
+        f"{'pk MiB':>9} {'(list,id)':>9} {'(list,..)':>9} {'total':>9}"
+    )
+    for name, (key_type, new_id) in LAYOUTS.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            rate, last_rate, sizes = run(
+                os.path.join(tmp, "ids.db"),
+                key_type,
+                new_id,
+                args.rows,
+                args.lists,
+                args.batch,
+            )
+        print(
+            f"{name:<13} {rate:9.0f} {last_rate:11.0f} "
+            f"{mib(sizes['sqlite_autoindex_tasks_1'])} "
+            f"{mib(sizes['ix_tasks_list_id_id'])} "
+            f"{mib(sizes['ix_tasks_list_id_completed_created_at'])} "
+            f"{mib(sum(sizes.values()))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark page latency from the first page to the last with keyset cursors.
+
+A list is seeded with --tasks tasks, then walked page by page through
+GET /v1/lists/{listId}/tasks?limit=... following X-Next-Cursor. Latencies
+are reported per tenth of the walk; with keyset pagination the last pages
+cost the same as the first. For contrast the same pages are fetched with
+LIMIT/OFFSET in plain SQL, whose cost grows with the depth. Requests go
+in-process through the ASGI transport against a fresh SQLite file.
+
+Usage:
+    python benchmarks/bench_pagination.py [--tasks 50000] [--limit 100]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+
+def by_tenth(latencies):
+    size = max(len(latencies) // 10, 1)
+    return [
+        statistics.median(latencies[i : i + size]) * 1000
+        for i in range(0, size * 10, size)
+        if latencies[i : i + size]
+    ]
+
+
+async def run(tasks: int, limit: int) -> dict:
+    import httpx
+    from sqlalchemy import insert, select
+
+    from app.database import Base, SessionLocal, engine
+    from app.main import app
+    from app.models.task import Task
+    from app.utils.security import generate_id
+
+    Base.metadata.create_all(bind=engine)
+    user = {"email": "bench@example.com", "password": "BenchPassword123!"}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.post("/v1/auth/register", json=user)
+        token = (await client.post("/v1/auth/login", json=user)).json()["token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        list_id = (
+            await client.post("/v1/lists/", json={"name": "Big"}, headers=headers)
+        ).json()["id"]
+
+        with SessionLocal() as db:
+            db.execute(
+                insert(Task),
+                [
+                    {"id": generate_id(), "list_id": list_id, "description": str(i)}
+                    for i in range(tasks)
+                ],
+            )
+            db.commit()
+
+        keyset = []
+        params = {"limit": limit}
+        while True:
+            start = time.perf_counter()
+            response = await client.get(
+                f"/v1/lists/{list_id}/tasks", params=params, headers=headers
+            )
+            keyset.append(time.perf_counter() - start)
+            assert response.status_code == 200
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params = {"limit": limit, "cursor": cursor}
+
+    offset = []
+    query = (
+        select(Task).where(Task.list_id == list_id).order_by(Task.created_at, Task.id)
+    )
+    with SessionLocal() as db:
+        for page in range(len(keyset)):
+            start = time.perf_counter()
+            db.scalars(query.limit(limit).offset(page * limit)).all()
+            offset.append(time.perf_counter() - start)
+
+    return {"keyset (HTTP)": by_tenth(keyset), "offset (SQL)": by_tenth(offset)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+        os.environ.setdefault("BCRYPT_ROUNDS", "4")
+        results = asyncio.run(run(args.tasks, args.limit))
+
+    print("median ms per page, by tenth of the walk (first -> last)")
+    for mode, medians in results.items():
+        print(f"{mode:<14} " + " ".join(f"{value:6.2f}" for value in medians))
+
+
+if __name__ == "__main__":
+    main()
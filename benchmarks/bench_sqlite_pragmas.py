@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLite write throughput with and without the connection pragmas.
+
+Several threads insert tasks, one transaction per insert, the way concurrent
+POST /lists/{id}/tasks requests do. The baseline engine uses SQLite defaults
+(rollback journal, synchronous=FULL, the 5s driver timeout); the tuned engine is
+built by create_db_engine with the SQLITE_* settings.
+
+Usage:
+    python benchmarks/bench_sqlite_pragmas.py [--threads 8] [--writes 250]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_db_engine
+from app.models.list import List
+from app.models.task import Task
+from app.models.user import User
+from app.utils.security import generate_id
+
+
+def run(engine, threads: int, writes: int) -> dict:
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    with SessionLocal() as db:
+        user = User(id=generate_id(), email="bench@example.com", hashed_password="x")
+        todo_list = List(id=generate_id(), name="Bench", user_id=user.id)
+        db.add_all([user, todo_list])
+        db.commit()
+
+    committed = [0]
+    locked = [0]
+    lock = threading.Lock()
+
+    def writer():
+        with SessionLocal() as db:
+            for i in range(writes):
+                db.add(Task(id=generate_id(), list_id=todo_list.id, description=str(i)))
+                try:
+                    db.commit()
+                except OperationalError:
+                    db.rollback()
+                    with lock:
+                        locked[0] += 1
+                else:
+                    with lock:
+                        committed[0] += 1
+
+    workers = [threading.Thread(target=writer) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    engine.dispose()
+    return {"writes_per_s": committed[0] / elapsed, "locked": locked[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=250)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'writes/s':>10} {'locked errors':>14}")
+    for name in ("default", "tuned"):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            if name == "default":
+                engine = create_engine(
+                    url,
+                    connect_args={"check_same_thread": False},
+                    pool_size=args.threads,
+                )
+            else:
+                engine = create_db_engine(url)
+            result = run(engine, args.threads, args.writes)
+        print(f"{name:<10} {result['writes_per_s']:10.0f} {result['locked']:14d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -87,6 +87,7 @@ class ApiService {
    */
   handleUnauthorized() {
     StorageUtils.remove(CONFIG.STORAGE.TOKEN);
+    StorageUtils.remove(CONFIG.STORAGE.REFRESH_TOKEN);
     StorageUtils.remove(CONFIG.STORAGE.USER);
     
     // Dispatch custom event for app to handle
@@ -101,9 +102,10 @@ class ApiService {
    */
   async request(endpoint, options = {}) {
     const url = `${this.baseURL}${endpoint}`;
+    const { withHeaders, ...fetchOptions } = options;
     const config = {
       headers: this.getAuthHeaders(),
-      ...options
+      ...fetchOptions
     };
 
     // Log API request if debugging is enabled
@@ -143,6 +145,9 @@ class ApiService {
         console.groupEnd();
       }
 
+      if (withHeaders) {
+        return { data: result, headers: response.headers };
+      }
       return result;
     } catch (error) {
       // Log API errors if debugging is enabled
@@ -170,9 +175,10 @@ class ApiService {
    * Make GET request
    * @param {string} endpoint - API endpoint
    * @param {Object} params - Query parameters
+   * @param {Object} options - Extra request options
    * @returns {Promise<Object>} - Response data
    */
-  async get(endpoint, params = {}) {
+  async get(endpoint, params = {}, options = {}) {
     const url = new URL(`${this.baseURL}${endpoint}`);
     
     // Add query parameters
@@ -183,10 +189,31 @@ class ApiService {
     });
 
     return this.request(url.pathname + url.search, {
-      method: 'GET'
+      method: 'GET',
+      ...options
     });
   }
 
+  /**
+   * GET every page of a paginated listing
+   * Follows the X-Next-Cursor header until the last page
+   * @param {string} endpoint - API endpoint
+   * @param {Object} params - Query parameters
+   * @returns {Promise<Array>} - Items from all pages
+   */
+  async getAllPages(endpoint, params = {}) {
+    const items = [];
+    let cursor = null;
+
+    do {
+      const page = await this.get(endpoint, { ...params, cursor }, { withHeaders: true });
+      items.push(...page.data);
+      cursor = page.headers.get('X-Next-Cursor');
+    } while (cursor);
+
+    return items;
+  }
+
   /**
    * Make POST request
    * @param {string} endpoint - API endpoint
@@ -259,10 +286,12 @@ class ApiService {
 
   /**
    * Refresh authentication token
-   * @returns {Promise<Object>} - New token
+   * Refresh tokens are single-use; the response carries the rotated one
+   * @param {string} refreshToken - Refresh token from login or the last refresh
+   * @returns {Promise<Object>} - New bearer token and refresh token
    */
-  async refreshToken() {
-    return this.post(CONFIG.API.ENDPOINTS.AUTH.REFRESH);
+  async refreshToken(refreshToken) {
+    return this.post(CONFIG.API.ENDPOINTS.AUTH.REFRESH, { refresh_token: refreshToken });
   }
 
   // User API methods
@@ -288,11 +317,15 @@ class ApiService {
 
   /**
    * Get all lists for current user
+   * Without params.limit every page is fetched
    * @param {Object} params - Query parameters
    * @returns {Promise<Array>} - Array of lists
    */
   async getLists(params = {}) {
-    return this.get(CONFIG.API.ENDPOINTS.LISTS.BASE, params);
+    if (params.limit) {
+      return this.get(CONFIG.API.ENDPOINTS.LISTS.BASE, params);
+    }
+    return this.getAllPages(CONFIG.API.ENDPOINTS.LISTS.BASE, params);
   }
 
   /**
@@ -334,12 +367,16 @@ class ApiService {
 
   /**
    * Get tasks for a list
+   * Without params.limit every page is fetched
    * @param {string|number} listId - List ID
    * @param {Object} params - Query parameters
    * @returns {Promise<Array>} - Array of tasks
    */
   async getListTasks(listId, params = {}) {
-    return this.get(CONFIG.API.ENDPOINTS.LISTS.TASKS(listId), params);
+    if (params.limit) {
+      return this.get(CONFIG.API.ENDPOINTS.LISTS.TASKS(listId), params);
+    }
+    return this.getAllPages(CONFIG.API.ENDPOINTS.LISTS.TASKS(listId), params);
   }
 
   // Tasks API methods
@@ -77,9 +77,10 @@ class AuthManager {
   async login(credentials) {
     try {
       const response = await apiService.login(credentials);
+      const token = response.token || response.access_token;
       
-      if (response.access_token) {
-        this.setAuthData(response.access_token, response.user || response);
+      if (token) {
+        this.setAuthData(token, response.user || response, response.refresh_token);
         this.notifyAuthChange('login');
         return { success: true, user: this.currentUser };
       }
@@ -114,12 +115,19 @@ class AuthManager {
    * @returns {Promise<boolean>} - Success status
    */
   async refreshToken() {
+    const refreshToken = StorageUtils.get(CONFIG.STORAGE.REFRESH_TOKEN);
+    if (!refreshToken) {
+      return false;
+    }
+
     try {
-      const response = await apiService.refreshToken();
+      const response = await apiService.refreshToken(refreshToken);
       
-      if (response.access_token) {
-        this.token = response.access_token;
+      if (response.token) {
+        this.token = response.token;
         StorageUtils.set(CONFIG.STORAGE.TOKEN, this.token);
+        // The old refresh token is now spent; reusing it revokes the session
+        StorageUtils.set(CONFIG.STORAGE.REFRESH_TOKEN, response.refresh_token);
         return true;
       }
       
@@ -135,8 +143,9 @@ class AuthManager {
    * Set authentication data
    * @param {string} token - Access token
    * @param {Object} user - User data
+   * @param {string} [refreshToken] - Refresh token, when the response has one
    */
-  setAuthData(token, user) {
+  setAuthData(token, user, refreshToken = null) {
     this.token = token;
     this.currentUser = user;
     this.isAuthenticated = true;
@@ -144,6 +153,9 @@ class AuthManager {
     // Store in localStorage
     StorageUtils.set(CONFIG.STORAGE.TOKEN, token);
     StorageUtils.set(CONFIG.STORAGE.USER, user);
+    if (refreshToken) {
+      StorageUtils.set(CONFIG.STORAGE.REFRESH_TOKEN, refreshToken);
+    }
   }
 
   /**
@@ -156,6 +168,7 @@ class AuthManager {
 
     // Clear from localStorage
     StorageUtils.remove(CONFIG.STORAGE.TOKEN);
+    StorageUtils.remove(CONFIG.STORAGE.REFRESH_TOKEN);
     StorageUtils.remove(CONFIG.STORAGE.USER);
   }
 
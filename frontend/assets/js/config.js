@@ -59,6 +59,7 @@ const CONFIG = {
   // Local Storage Keys
   STORAGE: {
     TOKEN: 'todo-app-token',
+    REFRESH_TOKEN: 'todo-app-refresh-token',
     USER: 'todo-app-user',
     THEME: 'todo-app-theme',
     PREFERENCES: 'todo-app-preferences'
@@ -0,0 +1,93 @@
+"""baseline schema
+
+Schema as previously created by Base.metadata.create_all (users, lists and
+tasks). Databases created that way are stamped at this revision by
+app.utils.migrations instead of running it. Key columns use IdType, so ID_STORAGE decides between hex
+strings and 16-byte binary when the database is first created.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 23:01:54.673928
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.models.types import IdType
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", IdType(), nullable=False),
+        sa.Column("username", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_users")),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+    op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
+
+    op.create_table(
+        "lists",
+        sa.Column("id", IdType(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("user_id", IdType(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"], ["users.id"], name=op.f("fk_lists_user_id_users")
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_lists")),
+    )
+    op.create_index(op.f("ix_lists_id"), "lists", ["id"], unique=False)
+
+    op.create_table(
+        "tasks",
+        sa.Column("id", IdType(), nullable=False),
+        sa.Column("list_id", IdType(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+        sa.Column("completed", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["list_id"], ["lists.id"], name=op.f("fk_tasks_list_id_lists")
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_tasks")),
+    )
+    op.create_index(op.f("ix_tasks_id"), "tasks", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("tasks")
+    op.drop_table("lists")
+    op.drop_table("users")
@@ -0,0 +1,44 @@
+"""composite indexes for the list and task queries
+
+Databases that ran the old migrate_db.py already have these indexes, so each
+one is only created when missing.
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-16 23:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_lists_user_id_created_at", "lists", ["user_id", "created_at"]),
+    (
+        "ix_tasks_list_id_completed_created_at",
+        "tasks",
+        ["list_id", "completed", "created_at"],
+    ),
+    ("ix_tasks_list_id_id", "tasks", ["list_id", "id"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
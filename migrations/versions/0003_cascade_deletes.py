@@ -0,0 +1,71 @@
+"""on delete cascade for child foreign keys
+
+Deleting a list or user now lets the database remove its tasks, lists and
+refresh tokens. Each foreign key is dropped under the name it actually has:
+databases built by create_all on PostgreSQL carry default names such as
+lists_user_id_fkey, and on SQLite they are unnamed, which batch mode resolves
+through the naming convention. Batch mode rebuilds the tables on SQLite, so
+this must run on a connection without foreign_keys=ON (see env.py).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:20:00.000000
+
+"""
+
+from typing import Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.database import NAMING_CONVENTION
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEYS = [
+    ("lists", "user_id", "users"),
+    ("tasks", "list_id", "lists"),
+    ("refresh_tokens", "user_id", "users"),
+]
+
+
+def existing_name(table: str, column: str, referred: str) -> Optional[str]:
+    """Name of the foreign key as it exists in this database"""
+    inspector = sa.inspect(op.get_bind())
+    for foreign_key in inspector.get_foreign_keys(table):
+        if (
+            foreign_key["constrained_columns"] == [column]
+            and foreign_key["referred_table"] == referred
+        ):
+            # Unnamed (SQLite create_all) keys get the convention name in batch
+            return foreign_key["name"] or f"fk_{table}_{column}_{referred}"
+    return None
+
+
+def replace_foreign_keys(ondelete: Optional[str]) -> None:
+    for table, column, referred in FOREIGN_KEYS:
+        current = existing_name(table, column, referred)
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            if current is not None:
+                batch_op.drop_constraint(current, type_="foreignkey")
+            batch_op.create_foreign_key(
+                op.f(f"fk_{table}_{column}_{referred}"),
+                referred,
+                [column],
+                ["id"],
+                ondelete=ondelete,
+            )
+
+
+def upgrade() -> None:
+    replace_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    replace_foreign_keys(None)
@@ -0,0 +1,60 @@
+"""indexes ending in (created_at, id) for keyset pagination
+
+Lists and tasks are paged on (created_at, id) within their parent. With id
+as the last index column every page is one range scan; without it rows that
+share a created_at second had to be sorted on each request. Databases adopted
+from create_all may already have the new indexes, so each step checks first.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 01:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def index_names(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    existing = index_names("lists")
+    if "ix_lists_user_id_created_at_id" not in existing:
+        op.create_index(
+            "ix_lists_user_id_created_at_id",
+            "lists",
+            ["user_id", "created_at", "id"],
+            unique=False,
+        )
+    if "ix_lists_user_id_created_at" in existing:
+        op.drop_index("ix_lists_user_id_created_at", table_name="lists")
+
+    if "ix_tasks_list_id_created_at_id" not in index_names("tasks"):
+        op.create_index(
+            "ix_tasks_list_id_created_at_id",
+            "tasks",
+            ["list_id", "created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_list_id_created_at_id", table_name="tasks")
+    op.create_index(
+        "ix_lists_user_id_created_at",
+        "lists",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_lists_user_id_created_at_id", table_name="lists")
@@ -0,0 +1,70 @@
+"""indexes for filtered and sorted task listings
+
+GET /lists/{listId}/tasks filters on completed and sorts by created_at,
+updated_at (last modification: coalesce(updated_at, created_at)) or
+description, keyset-paged on (key, id). Each sort gets an index ending in
+(key, id); the completed index gains id so its pages need no sort either.
+Databases adopted from create_all may already have them, so each step
+checks first.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 01:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def index_names() -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes("tasks")}
+
+
+def upgrade() -> None:
+    existing = index_names()
+    if "ix_tasks_list_id_completed_created_at_id" not in existing:
+        op.create_index(
+            "ix_tasks_list_id_completed_created_at_id",
+            "tasks",
+            ["list_id", "completed", "created_at", "id"],
+            unique=False,
+        )
+    if "ix_tasks_list_id_completed_created_at" in existing:
+        op.drop_index("ix_tasks_list_id_completed_created_at", table_name="tasks")
+    if "ix_tasks_list_id_description_id" not in existing:
+        op.create_index(
+            "ix_tasks_list_id_description_id",
+            "tasks",
+            ["list_id", "description", "id"],
+            unique=False,
+        )
+    # Expression indexes are not reflected on SQLite, so let the database check
+    op.create_index(
+        "ix_tasks_list_id_updated_at_id",
+        "tasks",
+        ["list_id", sa.text("coalesce(updated_at, created_at)"), "id"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_list_id_updated_at_id", table_name="tasks")
+    op.drop_index("ix_tasks_list_id_description_id", table_name="tasks")
+    op.create_index(
+        "ix_tasks_list_id_completed_created_at",
+        "tasks",
+        ["list_id", "completed", "created_at"],
+        unique=False,
+    )
+    op.drop_index("ix_tasks_list_id_completed_created_at_id", table_name="tasks")
@@ -1,20 +1,26 @@
 """
 Test configuration and fixtures for Todo List API
 """
+import os
 import pytest
 import asyncio
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.database import Base, get_db
+# Cheap bcrypt cost for the test suite; must be set before app.config is imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+from app.database import Base, apply_sqlite_pragmas, get_db, primary_pins
 from app.models.user import User
 from app.models.list import List
 from app.models.task import Task
 from app.services.auth_service import AuthService
 from app.routers import auth, lists, tasks
+from app.utils.auth_cache import clear_auth_caches as _clear_auth_caches
+from app.utils.rate_limit import rate_limiter
 
 
 # Use SQLite in-memory database for testing
@@ -25,7 +31,11 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Same pragmas as the app's engines (foreign_keys=ON makes ON DELETE CASCADE work)
+apply_sqlite_pragmas(engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def create_test_app():
@@ -58,6 +68,18 @@ def create_test_app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Start every test with empty in-process auth caches, rate limits and primary pins"""
+    _clear_auth_caches()
+    rate_limiter.reset()
+    primary_pins.clear()
+    yield
+    _clear_auth_caches()
+    rate_limiter.reset()
+    primary_pins.clear()
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database session for each test"""
@@ -70,6 +92,31 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+class SQLStatement(str):
+    """SQL text as sent to the test database; .parameters holds its bound values"""
+
+
+class RecordedStatements(list):
+    """SQLStatements in the order they were executed"""
+
+    def selects(self):
+        return [s for s in self if s.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.fixture
+def statements(db_session):
+    """Record every SQL statement sent to the test database after schema setup"""
+    recorded = RecordedStatements()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(SQLStatement(statement))
+        recorded[-1].parameters = parameters
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture(scope="function")
 def override_get_db(db_session):
     """Override the get_db dependency"""
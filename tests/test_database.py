@@ -110,3 +110,341 @@ class TestDatabase:
         
         # Verify it exists in this session
         assert db_session.query(User).filter(User.email == "isolated@example.com").first() is not None
+
+
+class TestPoolConfiguration:
+    """Test cases for connection pool configuration and metrics"""
+
+    def test_file_database_uses_configured_queue_pool(self, tmp_path):
+        """Test that pool parameters come from settings"""
+        from app.database import create_db_engine
+        from app.utils.pool_metrics import InstrumentedQueuePool
+
+        pool_engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+        assert isinstance(pool_engine.pool, InstrumentedQueuePool)
+        assert pool_engine.pool.size() == settings.db_pool_size
+        assert pool_engine.pool._max_overflow == settings.db_max_overflow
+        assert pool_engine.pool._pre_ping == settings.db_pool_pre_ping
+        pool_engine.dispose()
+
+    def test_memory_database_skips_queue_options(self):
+        """Test that in-memory SQLite keeps its single-connection pool"""
+        from app.database import create_db_engine
+        from app.utils.pool_metrics import InstrumentedQueuePool
+
+        memory_engine = create_db_engine("sqlite:///:memory:")
+        assert not isinstance(memory_engine.pool, InstrumentedQueuePool)
+
+    def test_metrics_record_checkouts_and_timeouts(self, tmp_path, monkeypatch):
+        """Test checkout, overflow and timeout instrumentation"""
+        from sqlalchemy import text
+        from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+        from app.database import create_db_engine
+        from app.utils.pool_metrics import PoolMetrics
+
+        monkeypatch.setattr(settings, "db_pool_size", 1)
+        monkeypatch.setattr(settings, "db_max_overflow", 1)
+        monkeypatch.setattr(settings, "db_pool_timeout", 0.05)
+        pool_engine = create_db_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+        metrics = PoolMetrics().attach(pool_engine)
+
+        first = pool_engine.connect()
+        second = pool_engine.connect()  # uses the overflow slot
+        first.execute(text("SELECT 1"))
+        with pytest.raises(PoolTimeoutError):
+            pool_engine.connect()
+        first.close()
+        second.close()
+
+        stats = metrics.snapshot(pool_engine)
+        assert stats["checkouts"] == 2
+        assert stats["checkins"] == 2
+        assert stats["connects"] == 2
+        assert stats["timeouts"] == 1
+        assert stats["peak_overflow"] == 1
+        assert stats["peak_checked_out"] == 2
+        assert stats["checkout_wait_count"] == 3
+        assert stats["checkout_wait_max_ms"] >= 50
+        assert stats["checked_out"] == 0
+        pool_engine.dispose()
+
+    def test_internal_stats_endpoint(self, monkeypatch):
+        """Test that pool and cache counters are reachable with the internal token"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.routers import internal
+
+        monkeypatch.setattr(settings, "internal_token", "s3cret")
+        app = FastAPI()
+        app.include_router(internal.router)
+        response = TestClient(app).get("/internal/stats", headers={"X-Internal-Token": "s3cret"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "checkouts" in data["database_pool"]
+        assert set(data["caches"]) == {"basic_auth_credentials", "principals", "tokens"}
+        assert "pending" in data["password_hasher"]
+
+
+    def test_internal_stats_requires_access(self, monkeypatch):
+        """Test that the stats endpoint rejects wrong tokens and, without INTERNAL_TOKEN, everyone"""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.routers import internal
+
+        app = FastAPI()
+        app.include_router(internal.router)
+        client = TestClient(app)
+
+        monkeypatch.setattr(settings, "internal_token", None)
+        assert client.get("/internal/stats").status_code == 403
+        monkeypatch.setattr(settings, "internal_token", "")
+        assert client.get("/internal/stats", headers={"X-Internal-Token": ""}).status_code == 403
+
+        monkeypatch.setattr(settings, "internal_token", "s3cret")
+        assert client.get("/internal/stats").status_code == 403
+        assert client.get("/internal/stats", headers={"X-Internal-Token": "wrong"}).status_code == 403
+
+    def test_internal_endpoints_disabled_by_default(self):
+        """Test that /internal is not mounted unless INTERNAL_ENDPOINTS_ENABLED is set"""
+        from app.config import Settings
+
+        assert Settings.model_fields["internal_endpoints_enabled"].default is False
+
+
+class TestAsyncDatabaseMode:
+    """Test cases for the async data path (DATABASE_MODE=async)"""
+
+    def test_async_url_derivation(self):
+        """Test that sync URLs map onto their async drivers"""
+        from app.database import to_async_url
+
+        assert to_async_url("sqlite:///./todo.db") == "sqlite+aiosqlite:///./todo.db"
+        assert to_async_url("postgresql://u:p@localhost/db") == "postgresql+asyncpg://u:p@localhost/db"
+        with pytest.raises(ValueError):
+            to_async_url("mysql://u:p@localhost/db")
+
+    def test_routes_run_on_async_session(self, tmp_path):
+        """Test the auth, list and task flow against an AsyncSession"""
+        import asyncio
+        from fastapi.testclient import TestClient
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+        from app.database import create_async_db_engine
+        from tests.conftest import create_test_app
+
+        url = f"sqlite:///{tmp_path / 'async.db'}"
+        sync_engine = create_engine(url)
+        Base.metadata.create_all(bind=sync_engine)
+        sync_engine.dispose()
+
+        async_engine = create_async_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+        AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+        sessions = []
+
+        async def override_get_db():
+            async with AsyncTestingSessionLocal() as session:
+                sessions.append(session)
+                yield session
+
+        app = create_test_app()
+        app.dependency_overrides[get_db] = override_get_db
+        user_data = {"email": "async@example.com", "password": "AsyncPassword123!"}
+
+        with TestClient(app) as client:
+            assert client.post("/auth/register", json=user_data).status_code == 201
+            token = client.post("/auth/login", json=user_data).json()["token"]
+            headers = {"Authorization": f"Bearer {token}"}
+
+            todo_list = client.post("/lists", json={"name": "Async"}, headers=headers).json()
+            task = client.post(
+                f"/lists/{todo_list['id']}/tasks", json={"description": "Async task"}, headers=headers
+            ).json()
+            response = client.put(f"/tasks/{task['id']}", json={"completed": True}, headers=headers)
+            assert response.status_code == 200
+            assert response.json()["completed"] is True
+
+            tasks = client.get(f"/lists/{todo_list['id']}/tasks", headers=headers).json()
+            assert [item["id"] for item in tasks] == [task["id"]]
+            assert client.get("/auth/me", headers=headers).json()["email"] == user_data["email"]
+
+        assert sessions and all(isinstance(session, AsyncSession) for session in sessions)
+        asyncio.run(async_engine.dispose())
+
+
+class TestSQLitePragmas:
+    """Test cases for the SQLite connection profile"""
+
+    def _pragma(self, connection, name):
+        from sqlalchemy import text
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_pragmas_applied_on_connect(self, tmp_path):
+        """Test that every new connection gets the configured pragmas"""
+        from app.database import create_db_engine
+
+        file_engine = create_db_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+        with file_engine.connect() as connection:
+            assert self._pragma(connection, "journal_mode") == "wal"
+            assert self._pragma(connection, "synchronous") == 1  # NORMAL
+            assert self._pragma(connection, "busy_timeout") == settings.sqlite_busy_timeout_ms
+            assert self._pragma(connection, "cache_size") == settings.sqlite_cache_size
+            assert self._pragma(connection, "temp_store") == 2  # MEMORY
+            assert self._pragma(connection, "foreign_keys") == 1
+        file_engine.dispose()
+
+    def test_unset_pragmas_keep_sqlite_defaults(self, tmp_path, monkeypatch):
+        """Test that a None setting skips its pragma"""
+        from app.database import create_db_engine, sqlite_pragmas
+
+        monkeypatch.setattr(settings, "sqlite_journal_mode", None)
+        monkeypatch.setattr(settings, "sqlite_foreign_keys", False)
+        assert not any("journal_mode" in statement for statement in sqlite_pragmas())
+
+        file_engine = create_db_engine(f"sqlite:///{tmp_path / 'defaults.db'}")
+        with file_engine.connect() as connection:
+            assert self._pragma(connection, "journal_mode") == "delete"
+            assert self._pragma(connection, "foreign_keys") == 0
+        file_engine.dispose()
+
+
+class TestReadReplicaRouting:
+    """Test cases for primary/replica routing of GET handlers"""
+
+    @pytest.fixture
+    def replica_client(self, tmp_path):
+        """Client whose primary and replica are two separate SQLite files"""
+        from fastapi.testclient import TestClient
+        from app.database import get_replica_db
+        from tests.conftest import create_test_app
+
+        factories = {}
+        for name in ("primary", "replica"):
+            file_engine = create_engine(
+                f"sqlite:///{tmp_path / name}.db", connect_args={"check_same_thread": False}
+            )
+            Base.metadata.create_all(bind=file_engine)
+            factories[name] = sessionmaker(bind=file_engine, autoflush=False, expire_on_commit=False)
+
+        def session_from(factory):
+            def _get_session():
+                db = factory()
+                try:
+                    yield db
+                finally:
+                    db.close()
+            return _get_session
+
+        app = create_test_app()
+        app.dependency_overrides[get_db] = session_from(factories["primary"])
+        app.dependency_overrides[get_replica_db] = session_from(factories["replica"])
+
+        with TestClient(app) as client:
+            yield client, factories
+
+    def _login(self, client, sample_user_data):
+        client.post("/auth/register", json=sample_user_data)
+        token = client.post("/auth/login", json=sample_user_data).json()["token"]
+        return {"Authorization": f"Bearer {token}"}
+
+    def test_reads_pinned_to_primary_after_write(self, replica_client, sample_user_data):
+        """Test read-your-writes: a fresh write is visible on the next GET"""
+        from app.database import is_pinned_to_primary
+
+        client, _ = replica_client
+        headers = self._login(client, sample_user_data)
+        todo_list = client.post("/lists", json={"name": "Fresh"}, headers=headers).json()
+
+        assert is_pinned_to_primary(todo_list["userId"])
+        response = client.get("/lists", headers=headers)
+        assert [item["id"] for item in response.json()] == [todo_list["id"]]
+
+    def test_dml_writes_pin_to_primary(self, replica_client, sample_user_data):
+        """Test read-your-writes for writes issued as INSERT/UPDATE ... RETURNING (no flush)"""
+        from app.database import is_pinned_to_primary, primary_pins
+
+        client, _ = replica_client
+        headers = self._login(client, sample_user_data)
+        todo_list = client.post("/lists", json={"name": "Fresh"}, headers=headers).json()
+        primary_pins.clear()
+
+        task = client.post(f"/lists/{todo_list['id']}/tasks", json={"description": "New"}, headers=headers)
+        assert task.status_code == 201
+        assert is_pinned_to_primary(todo_list["userId"])
+        assert client.get(f"/tasks/{task.json()['id']}", headers=headers).status_code == 200
+        assert [item["id"] for item in client.get(f"/lists/{todo_list['id']}/tasks", headers=headers).json()] == [
+            task.json()["id"]
+        ]
+
+        primary_pins.clear()
+        response = client.post(f"/tasks/{task.json()['id']}/complete", headers=headers)
+        assert response.status_code == 200
+        assert is_pinned_to_primary(todo_list["userId"])
+        assert client.get(f"/tasks/{task.json()['id']}", headers=headers).json()["completed"] is True
+
+    def test_reads_go_to_replica_outside_pin_window(self, replica_client, sample_user_data):
+        """Test that GET handlers read the replica once the pin has expired"""
+        from app.database import primary_pins
+        from app.models.list import List as ListModel
+
+        client, factories = replica_client
+        headers = self._login(client, sample_user_data)
+        todo_list = client.post("/lists", json={"name": "Primary"}, headers=headers).json()
+        primary_pins.clear()
+
+        # Nothing replicates between the two files, so the replica is still empty
+        assert client.get("/lists", headers=headers).json() == []
+        assert client.get(f"/lists/{todo_list['id']}/tasks", headers=headers).status_code == 404
+
+        with factories["replica"]() as replica:
+            replica.add(ListModel(id="replica-list", name="Replica", user_id=todo_list["userId"]))
+            replica.commit()
+        assert [item["id"] for item in client.get("/lists", headers=headers).json()] == ["replica-list"]
+
+        # Handlers without get_read_db keep reading the primary
+        assert client.get(f"/lists/{todo_list['id']}", headers=headers).status_code == 200
+
+
+class TestBinaryIdStorage:
+    """Test cases for ID_STORAGE=binary"""
+
+    def test_ids_stored_as_16_bytes_and_served_as_hex(self, tmp_path, monkeypatch):
+        """Test that keys are BLOBs in the database but hex strings in the API"""
+        from fastapi.testclient import TestClient
+        from sqlalchemy import text
+        from tests.conftest import create_test_app
+
+        monkeypatch.setattr(settings, "id_storage", "binary")
+        file_engine = create_engine(
+            f"sqlite:///{tmp_path / 'binary.db'}", connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(bind=file_engine)
+        BinarySessionLocal = sessionmaker(bind=file_engine, autoflush=False, expire_on_commit=False)
+
+        def override_get_db():
+            db = BinarySessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = create_test_app()
+        app.dependency_overrides[get_db] = override_get_db
+        user_data = {"email": "binary@example.com", "password": "BinaryPassword123!"}
+
+        with TestClient(app) as client:
+            client.post("/auth/register", json=user_data)
+            token = client.post("/auth/login", json=user_data).json()["token"]
+            headers = {"Authorization": f"Bearer {token}"}
+            todo_list = client.post("/lists", json={"name": "Binary"}, headers=headers).json()
+            task = client.post(
+                f"/lists/{todo_list['id']}/tasks", json={"description": "Stored as bytes"}, headers=headers
+            ).json()
+
+            assert len(task["id"]) == 32 and task["listId"] == todo_list["id"]
+            assert client.get(f"/tasks/{task['id']}", headers=headers).json()["id"] == task["id"]
+            assert client.get("/tasks/not-a-hex-id", headers=headers).status_code == 404
+
+        with file_engine.connect() as connection:
+            stored = connection.execute(text("SELECT typeof(id), length(id), typeof(list_id) FROM tasks")).one()
+        assert tuple(stored) == ("blob", 16, "blob")
+        file_engine.dispose()
@@ -49,3 +49,93 @@ class TestMainApp:
         assert "openapi" in data
         assert "info" in data
         assert "paths" in data
+
+    def test_cors_exposes_pagination_headers(self):
+        """Test that browsers may read Link and X-Next-Cursor on cross-origin responses"""
+        from app.main import app
+
+        # Without the context manager the lifespan (migrations, warmup) does not run
+        response = TestClient(app).get("/health", headers={"Origin": "http://frontend.example"})
+
+        assert response.status_code == 200
+        exposed = response.headers["Access-Control-Expose-Headers"]
+        assert "Link" in exposed and "X-Next-Cursor" in exposed
+
+
+class TestStartup:
+    """Test cases for import-time behaviour and the application lifespan"""
+
+    def test_import_does_not_touch_database(self, tmp_path):
+        """Test that importing app.main opens no database connection"""
+        import os
+        import subprocess
+        import sys
+
+        database = tmp_path / "untouched.db"
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{database}")
+        subprocess.run([sys.executable, "-c", "import app.main"], env=env, check=True)
+
+        assert not database.exists()
+
+    def test_lifespan_migrates_when_enabled(self, tmp_path, monkeypatch):
+        """Test that MIGRATE_ON_STARTUP upgrades the database during startup"""
+        from sqlalchemy import create_engine, inspect
+        from app.config import settings
+        from app.main import app
+
+        url = f"sqlite:///{tmp_path / 'startup.db'}"
+        monkeypatch.setattr(settings, "database_url", url)
+        monkeypatch.setattr(settings, "migrate_on_startup", True)
+        monkeypatch.setattr(settings, "startup_warmup", False)
+        monkeypatch.setattr(settings, "password_hash_calibrate_on_startup", False)
+
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+
+        file_engine = create_engine(url)
+        assert {"users", "lists", "tasks", "alembic_version"} <= set(inspect(file_engine).get_table_names())
+        file_engine.dispose()
+
+    def test_calibration_does_not_delay_startup(self, monkeypatch):
+        """Test that the password hash calibration runs after startup, in the background"""
+        import threading
+        import app.main as main
+        from app.config import settings
+
+        release = threading.Event()
+        finished = threading.Event()
+
+        def slow_calibration():
+            release.wait(timeout=5)
+            finished.set()
+            return 1.0
+
+        monkeypatch.setattr(main, "calibrate_password_hash", slow_calibration)
+        monkeypatch.setattr(settings, "migrate_on_startup", False)
+        monkeypatch.setattr(settings, "startup_warmup", False)
+        monkeypatch.setattr(settings, "password_hash_calibrate_on_startup", True)
+
+        try:
+            with TestClient(main.app) as client:
+                assert client.get("/health").status_code == 200
+                assert not finished.is_set()
+        finally:
+            release.set()
+
+    def test_warmup_preloads_backends_and_pool(self, tmp_path):
+        """Test that warmup opens pooled connections ahead of the first request"""
+        import asyncio
+        from app.config import settings
+        from app.database import create_db_engine
+        from app.utils.hashing import password_hasher
+        from app.utils.warmup import warmup
+
+        file_engine = create_db_engine(f"sqlite:///{tmp_path / 'warm.db'}")
+        try:
+            timings = asyncio.run(warmup(file_engine))
+        finally:
+            password_hasher.shutdown()
+
+        assert set(timings) == {"password_hashing", "jwt", "database_pool"}
+        assert file_engine.pool.checkedin() == settings.warmup_pool_connections
+        file_engine.dispose()
@@ -0,0 +1,183 @@
+"""
+Tests for the Alembic migration pipeline
+"""
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, event, inspect, text
+from app.database import Base
+from app.models.list import List
+from app.models.task import Task
+from app.models.user import User
+from app.utils.migrations import alembic_config, backfill_in_batches, upgrade_database
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'migrations.db'}"
+
+
+def current_revision(url):
+    file_engine = create_engine(url)
+    with file_engine.connect() as connection:
+        revision = MigrationContext.configure(connection).get_current_revision()
+    file_engine.dispose()
+    return revision
+
+
+class TestMigrations:
+    """Test cases for the migration scripts"""
+
+    def test_upgrade_matches_models(self, database_url):
+        """Test that head builds exactly the schema the models describe"""
+        upgrade_database(database_url)
+
+        file_engine = create_engine(database_url)
+        with file_engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+        file_engine.dispose()
+        assert diff == []
+
+    def test_downgrade_to_base_and_back(self, database_url):
+        """Test that every revision can be reverted and re-applied"""
+        config = alembic_config(database_url)
+        upgrade_database(database_url)
+        command.downgrade(config, "base")
+
+        file_engine = create_engine(database_url)
+        assert set(inspect(file_engine).get_table_names()) == {"alembic_version"}
+        file_engine.dispose()
+
+        upgrade_database(database_url)
+        assert current_revision(database_url) == ScriptDirectory.from_config(config).get_current_head()
+
+    def test_create_all_database_is_adopted(self, database_url):
+        """Test that a database built by the old create_all (users, lists, tasks) is stamped, then upgraded"""
+        file_engine = create_engine(database_url)
+        with file_engine.begin() as connection:
+            for statement in (
+                "CREATE TABLE users (id VARCHAR NOT NULL, username VARCHAR, email VARCHAR NOT NULL, "
+                "hashed_password VARCHAR NOT NULL, is_active BOOLEAN, is_verified BOOLEAN, "
+                "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), updated_at DATETIME, PRIMARY KEY (id))",
+                "CREATE UNIQUE INDEX ix_users_email ON users (email)",
+                "CREATE INDEX ix_users_id ON users (id)",
+                "CREATE UNIQUE INDEX ix_users_username ON users (username)",
+                "CREATE TABLE lists (id VARCHAR NOT NULL, name VARCHAR NOT NULL, user_id VARCHAR NOT NULL, "
+                "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), updated_at DATETIME, PRIMARY KEY (id), "
+                "FOREIGN KEY(user_id) REFERENCES users (id))",
+                "CREATE INDEX ix_lists_id ON lists (id)",
+                "CREATE TABLE tasks (id VARCHAR NOT NULL, list_id VARCHAR NOT NULL, description VARCHAR NOT NULL, "
+                "completed BOOLEAN, created_at DATETIME DEFAULT (CURRENT_TIMESTAMP), updated_at DATETIME, "
+                "PRIMARY KEY (id), FOREIGN KEY(list_id) REFERENCES lists (id))",
+                "CREATE INDEX ix_tasks_id ON tasks (id)",
+                "INSERT INTO users (id, email, hashed_password) VALUES ('u', 'u@example.com', 'x')",
+                "INSERT INTO lists (id, name, user_id) VALUES ('l', 'Old', 'u')",
+                "INSERT INTO tasks (id, list_id, description) VALUES ('t', 'l', 'Old task')",
+            ):
+                connection.execute(text(statement))
+        file_engine.dispose()
+
+        upgrade_database(database_url)
+
+        config = alembic_config(database_url)
+        assert current_revision(database_url) == ScriptDirectory.from_config(config).get_current_head()
+        file_engine = create_engine(database_url)
+        tables = set(inspect(file_engine).get_table_names())
+        indexes = {index["name"] for index in inspect(file_engine).get_indexes("tasks")}
+        with file_engine.connect() as connection:
+            assert connection.execute(text("SELECT description FROM tasks")).scalar_one() == "Old task"
+        file_engine.dispose()
+        assert tables == {"alembic_version", "users", "lists", "tasks", "refresh_tokens"}
+        assert "ix_tasks_list_id_id" in indexes
+
+    def test_database_with_refresh_tokens_is_adopted(self, database_url):
+        """Test that a create_all database that already has refresh_tokens upgrades too"""
+        file_engine = create_engine(database_url)
+        Base.metadata.create_all(bind=file_engine)
+        file_engine.dispose()
+
+        upgrade_database(database_url)
+
+        config = alembic_config(database_url)
+        assert current_revision(database_url) == ScriptDirectory.from_config(config).get_current_head()
+
+    def test_cascade_foreign_keys_replace_unnamed_ones(self, database_url):
+        """Test that 0003 rebuilds unnamed create_all foreign keys with ON DELETE CASCADE"""
+        file_engine = create_engine(database_url)
+        with file_engine.begin() as connection:
+            for statement in (
+                "CREATE TABLE users (id VARCHAR PRIMARY KEY, email VARCHAR)",
+                "CREATE TABLE lists (id VARCHAR PRIMARY KEY, user_id VARCHAR NOT NULL REFERENCES users (id))",
+                "CREATE TABLE tasks (id VARCHAR PRIMARY KEY, list_id VARCHAR NOT NULL REFERENCES lists (id))",
+                "CREATE TABLE refresh_tokens (id VARCHAR PRIMARY KEY, user_id VARCHAR NOT NULL REFERENCES users (id))",
+                "INSERT INTO users VALUES ('u', 'u@example.com')",
+                "INSERT INTO lists VALUES ('l', 'u')",
+                "INSERT INTO tasks VALUES ('t', 'l')",
+            ):
+                connection.execute(text(statement))
+        file_engine.dispose()
+        command.stamp(alembic_config(database_url), "0002")
+
+        upgrade_database(database_url, "0003")
+
+        file_engine = create_engine(database_url)
+        foreign_keys = inspect(file_engine).get_foreign_keys("tasks")
+        assert [(fk["name"], fk["options"].get("ondelete")) for fk in foreign_keys] == [
+            ("fk_tasks_list_id_lists", "CASCADE")
+        ]
+        with file_engine.begin() as connection:
+            connection.execute(text("PRAGMA foreign_keys=ON"))
+            connection.execute(text("DELETE FROM users WHERE id = 'u'"))
+            assert connection.execute(text("SELECT COUNT(*) FROM tasks")).scalar() == 0
+        file_engine.dispose()
+
+    def test_cascade_downgrade_restores_plain_foreign_keys(self, database_url):
+        """Test that downgrading 0003 drops ON DELETE CASCADE again"""
+        upgrade_database(database_url)
+        command.downgrade(alembic_config(database_url), "0002")
+
+        file_engine = create_engine(database_url)
+        for table in ("lists", "tasks", "refresh_tokens"):
+            (foreign_key,) = inspect(file_engine).get_foreign_keys(table)
+            assert foreign_key["options"].get("ondelete") is None
+        file_engine.dispose()
+
+
+class TestBackfillInBatches:
+    """Test cases for the chunked backfill helper"""
+
+    def test_updates_every_row_one_batch_per_transaction(self, database_url):
+        """Test that rows are updated in keyset batches of batch_size"""
+        upgrade_database(database_url)
+        file_engine = create_engine(database_url)
+        with file_engine.begin() as connection:
+            connection.execute(User.__table__.insert(), [{"id": "u", "email": "u@example.com", "hashed_password": "x"}])
+            connection.execute(List.__table__.insert(), [{"id": "l", "name": "L", "user_id": "u"}])
+            connection.execute(
+                Task.__table__.insert(),
+                [{"id": f"t{i:03d}", "list_id": "l", "description": str(i), "completed": None} for i in range(25)],
+            )
+
+        updates = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE"):
+                updates.append(statement)
+
+        event.listen(file_engine, "before_cursor_execute", record)
+        tasks = Task.__table__
+        with file_engine.connect() as connection:
+            with Operations.context(MigrationContext.configure(connection)):
+                updated = backfill_in_batches(
+                    tasks, {"completed": False}, where=tasks.c.completed.is_(None), batch_size=10
+                )
+
+        assert updated == 25
+        assert len(updates) == 3
+        with file_engine.connect() as connection:
+            remaining = connection.execute(text("SELECT COUNT(*) FROM tasks WHERE completed IS NULL")).scalar()
+        assert remaining == 0
+        file_engine.dispose()
@@ -0,0 +1,121 @@
+"""
+Tests that the hot list/task queries are served by indexes
+"""
+import pytest
+from app.models.list import List
+from app.models.task import Task
+from app.models.user import User
+from app.services.lists_service import ListService
+from app.services.task_service import TaskService
+
+
+@pytest.fixture
+def owned_list(db_session):
+    """A user with one list holding a few tasks"""
+    user = User(id="user-1", email="plans@example.com", hashed_password="x")
+    todo_list = List(id="list-1", name="Plans", user_id=user.id)
+    db_session.add_all([user, todo_list])
+    db_session.add_all(
+        Task(id=f"task-{i}", list_id=todo_list.id, description=str(i), completed=i % 2 == 0)
+        for i in range(5)
+    )
+    db_session.commit()
+    return user, todo_list
+
+
+def explain(db_session, statement, parameters):
+    """Run EXPLAIN QUERY PLAN on a statement exactly as the service sent it"""
+    connection = db_session.connection()
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return " | ".join(row[-1] for row in rows)
+
+
+class TestHotQueryPlans:
+    """EXPLAIN-based checks for the queries run on every page view"""
+
+    def test_user_lists_use_user_id_index(self, db_session, owned_list, statements):
+        """Test that get_user_lists searches ix_lists_user_id_created_at_id"""
+        user, _ = owned_list
+        ListService(db_session).get_user_lists(user)
+
+        statement, = statements.selects()
+        plan = explain(db_session, statement, statement.parameters)
+        assert "USING INDEX ix_lists_user_id_created_at_id" in plan
+        assert "SCAN lists" not in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_deep_pages_seek_instead_of_sort(self, db_session, owned_list, statements):
+        """Test that a cursor page is an index range scan on (parent, created_at, id)"""
+        user, todo_list = owned_list
+        first = TaskService(db_session).get_tasks_by_list(todo_list.id, user, limit=2)
+        TaskService(db_session).get_tasks_by_list(todo_list.id, user, limit=2, cursor=first.next_cursor)
+
+        statement = statements.selects()[-1]
+        plan = explain(db_session, statement, statement.parameters)
+        assert "USING INDEX ix_tasks_list_id_created_at_id" in plan
+        assert "SCAN tasks" not in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_tasks_by_list_use_list_id_index(self, db_session, owned_list, statements):
+        """Test that get_tasks_by_list checks ownership and fetches tasks in one indexed query"""
+        user, todo_list = owned_list
+        TaskService(db_session).get_tasks_by_list(todo_list.id, user)
+
+        statement, = statements.selects()
+        plan = explain(db_session, statement, statement.parameters)
+        assert "USING INDEX ix_tasks_list_id_created_at_id" in plan
+        assert "SCAN tasks" not in plan
+        assert "SCAN lists" not in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.parametrize(
+        "options, index",
+        [
+            ({"sort": "created_at"}, "ix_tasks_list_id_created_at_id"),
+            ({"sort": "updated_at"}, "ix_tasks_list_id_updated_at_id"),
+            ({"sort": "description"}, "ix_tasks_list_id_description_id"),
+            ({"completed": True}, "ix_tasks_list_id_completed_created_at_id"),
+        ],
+    )
+    def test_filtered_and_sorted_pages_need_no_sort(self, db_session, owned_list, statements, options, index):
+        """Test that every ?sort= (and the completed filter) pages straight off its index"""
+        user, todo_list = owned_list
+        service = TaskService(db_session)
+        first = service.get_tasks_by_list(todo_list.id, user, limit=1, **options)
+        service.get_tasks_by_list(todo_list.id, user, limit=1, cursor=first.next_cursor, **options)
+
+        for statement in statements.selects():
+            # "completed IS 1" is not an equality PostgreSQL can seek on
+            assert "completed IS" not in statement
+            plan = explain(db_session, statement, statement.parameters)
+            assert f"INDEX {index}" in plan
+            assert "SCAN tasks" not in plan
+            assert "TEMP B-TREE" not in plan
+
+    def test_task_by_id_is_one_indexed_query(self, db_session, owned_list, statements):
+        """Test that get_task_by_id joins lists for the ownership check without scans"""
+        user, _ = owned_list
+        assert TaskService(db_session).get_task_by_id("task-1", user) is not None
+
+        statement, = statements.selects()
+        plan = explain(db_session, statement, statement.parameters)
+        assert "SCAN" not in plan
+
+    def test_completed_filter_and_age_order_use_composite_index(self, db_session, owned_list):
+        """Test that filtering on completed and ordering by created_at need no sort"""
+        plan = explain(
+            db_session,
+            "SELECT id FROM tasks WHERE list_id = ? AND completed = ? ORDER BY created_at",
+            ("list-1", True),
+        )
+        assert "INDEX ix_tasks_list_id_completed_created_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_list_scoped_id_order_uses_list_id_id_index(self, db_session, owned_list):
+        """Test that walking a list's tasks in id order needs no sort"""
+        plan = explain(
+            db_session, "SELECT id FROM tasks WHERE list_id = ? ORDER BY id", ("list-1",)
+        )
+        assert "ix_tasks_list_id_id" in plan
+        assert "TEMP B-TREE" not in plan
+
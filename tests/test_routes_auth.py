@@ -258,3 +258,87 @@ class TestAuthRoutes:
         
         response = client.get("/auth/me", headers=headers)
         assert response.status_code == 401
+
+
+class TestRefreshTokenRoutes:
+    """Test cases for refresh token rotation"""
+
+    def _login(self, client: TestClient, sample_user_data):
+        client.post("/auth/register", json=sample_user_data)
+        response = client.post("/auth/login", json={
+            "email": sample_user_data["email"],
+            "password": sample_user_data["password"]
+        })
+        assert response.status_code == 200
+        return response.json()
+
+    def test_login_returns_refresh_token(self, client: TestClient, sample_user_data, db_session):
+        """Test that login issues a refresh token stored only as a hash"""
+        from app.models.refresh_token import RefreshToken
+
+        data = self._login(client, sample_user_data)
+        assert data["refresh_token"]
+
+        stored = db_session.query(RefreshToken).one()
+        assert stored.token_hash != data["refresh_token"]
+        assert stored.revoked is False
+
+    def test_refresh_rotates_tokens(self, client: TestClient, sample_user_data):
+        """Test that refresh returns a working access token and a new refresh token"""
+        data = self._login(client, sample_user_data)
+
+        response = client.post("/auth/refresh", json={"refresh_token": data["refresh_token"]})
+        assert response.status_code == 200
+        refreshed = response.json()
+        assert refreshed["refresh_token"] != data["refresh_token"]
+
+        me = client.get("/auth/me", headers={"Authorization": f"Bearer {refreshed['token']}"})
+        assert me.status_code == 200
+        assert me.json()["email"] == sample_user_data["email"]
+
+    def test_refresh_does_not_hash_passwords(self, client: TestClient, sample_user_data, monkeypatch):
+        """Test that refreshing never runs a password hash or verify"""
+        data = self._login(client, sample_user_data)
+
+        from app.utils import security
+
+        def fail(*args, **kwargs):
+            raise AssertionError("password hashing must not run on refresh")
+
+        monkeypatch.setattr(security.pwd_context, "verify", fail)
+        monkeypatch.setattr(security.pwd_context, "hash", fail)
+
+        response = client.post("/auth/refresh", json={"refresh_token": data["refresh_token"]})
+        assert response.status_code == 200
+
+    def test_reuse_revokes_family(self, client: TestClient, sample_user_data):
+        """Test that replaying a rotated refresh token revokes the whole family"""
+        data = self._login(client, sample_user_data)
+        first = client.post("/auth/refresh", json={"refresh_token": data["refresh_token"]})
+        new_refresh_token = first.json()["refresh_token"]
+
+        replay = client.post("/auth/refresh", json={"refresh_token": data["refresh_token"]})
+        assert replay.status_code == 401
+
+        # The legitimate successor is revoked as well
+        response = client.post("/auth/refresh", json={"refresh_token": new_refresh_token})
+        assert response.status_code == 401
+
+    def test_refresh_with_invalid_token(self, client: TestClient):
+        """Test refreshing with an unknown token"""
+        response = client.post("/auth/refresh", json={"refresh_token": "not-a-real-token"})
+        assert response.status_code == 401
+
+    def test_refresh_with_expired_token(self, client: TestClient, sample_user_data, db_session):
+        """Test refreshing with an expired token"""
+        from datetime import datetime, timedelta
+        from app.models.refresh_token import RefreshToken
+
+        data = self._login(client, sample_user_data)
+        stored = db_session.query(RefreshToken).one()
+        stored.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        db_session.commit()
+
+        response = client.post("/auth/refresh", json={"refresh_token": data["refresh_token"]})
+        assert response.status_code == 401
+        assert "expired" in response.json()["detail"].lower()
@@ -66,6 +66,22 @@ class TestListsRoutes:
         assert all("id" in item for item in data)
         assert all("name" in item for item in data)
 
+    def test_get_todo_lists_paginated(self, client: TestClient, authenticated_user):
+        """Test that ?limit= pages lists and advertises the next page"""
+        headers = authenticated_user["headers"]
+        for i in range(3):
+            client.post("/lists", json={"name": f"List {i}"}, headers=headers)
+
+        response = client.get("/lists?limit=2", headers=headers)
+
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["List 0", "List 1"]
+        cursor = response.headers["X-Next-Cursor"]
+
+        response = client.get("/lists", params={"limit": 2, "cursor": cursor}, headers=headers)
+        assert [item["name"] for item in response.json()] == ["List 2"]
+        assert "X-Next-Cursor" not in response.headers
+
     def test_get_todo_lists_without_authentication(self, client: TestClient):
         """Test getting todo lists without authentication"""
         response = client.get("/lists")
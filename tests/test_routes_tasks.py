@@ -97,6 +97,162 @@ class TestTasksRoutes:
         assert data["description"] == "Task without title"
         assert data["completed"] is False
 
+    def test_create_tasks_batch_success(self, client: TestClient, todo_list_with_tasks):
+        """Test creating several tasks in one request"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        batch = [{"description": f"Batch task {i}", "completed": i == 1} for i in range(3)]
+
+        response = client.post(f"/lists/{list_id}/tasks/batch", json=batch, headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert [task["description"] for task in data] == [item["description"] for item in batch]
+        assert [task["completed"] for task in data] == [False, True, False]
+        assert all(task["listId"] == list_id and task["created_at"] for task in data)
+
+        response = client.get(f"/lists/{list_id}/tasks", headers=headers)
+        assert len(response.json()) == 6
+
+    def test_create_tasks_batch_too_large(self, client: TestClient, todo_list_with_tasks, monkeypatch):
+        """Test that batches above TASK_BATCH_MAX_SIZE are rejected whole"""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "task_batch_max_size", 2)
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        batch = [{"description": f"Batch task {i}"} for i in range(3)]
+
+        response = client.post(f"/lists/{list_id}/tasks/batch", json=batch, headers=headers)
+
+        assert response.status_code == 413
+        assert len(client.get(f"/lists/{list_id}/tasks", headers=headers).json()) == 3
+
+    def test_create_tasks_batch_list_not_found(self, client: TestClient, authenticated_user):
+        """Test batch creation for non-existent list"""
+        headers = authenticated_user["headers"]
+
+        response = client.post("/lists/999/tasks/batch", json=[{"description": "x"}], headers=headers)
+
+        assert response.status_code == 404
+
+    def test_create_tasks_batch_invalid_item(self, client: TestClient, todo_list_with_tasks):
+        """Test that one invalid item rejects the whole batch"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        batch = [{"description": "ok"}, {"completed": True}]
+
+        response = client.post(f"/lists/{list_id}/tasks/batch", json=batch, headers=headers)
+
+        assert response.status_code == 422
+        assert len(client.get(f"/lists/{list_id}/tasks", headers=headers).json()) == 3
+
+    def test_complete_and_incomplete_task(self, client: TestClient, todo_list_with_tasks):
+        """Test the complete/incomplete endpoints used by the frontend"""
+        headers = todo_list_with_tasks["headers"]
+        task_id = todo_list_with_tasks["tasks"][0]["id"]
+
+        response = client.post(f"/tasks/{task_id}/complete", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["completed"] is True
+
+        response = client.post(f"/tasks/{task_id}/incomplete", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["completed"] is False
+
+    def test_complete_task_not_found(self, client: TestClient, authenticated_user):
+        """Test completing a non-existent task"""
+        response = client.post("/tasks/999/complete", headers=authenticated_user["headers"])
+
+        assert response.status_code == 404
+
+    def test_complete_all_tasks_in_list(self, client: TestClient, todo_list_with_tasks):
+        """Test bulk completion of every task in a list"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        response = client.post(f"/lists/{list_id}/tasks/complete", json={"all": True}, headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+        tasks = client.get(f"/lists/{list_id}/tasks", headers=headers).json()
+        assert all(task["completed"] for task in tasks)
+
+        response = client.post(f"/lists/{list_id}/tasks/complete", json={"all": True}, headers=headers)
+        assert response.json()["count"] == 0
+
+    def test_complete_selected_tasks_in_list(self, client: TestClient, todo_list_with_tasks):
+        """Test bulk completion by ids"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        task_id = todo_list_with_tasks["tasks"][0]["id"]
+
+        response = client.post(f"/lists/{list_id}/tasks/complete", json={"ids": [task_id]}, headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+        completed = {task["id"] for task in client.get(f"/lists/{list_id}/tasks", headers=headers).json() if task["completed"]}
+        assert completed == {task_id}
+
+    def test_complete_tasks_requires_selection(self, client: TestClient, todo_list_with_tasks):
+        """Test that exactly one of ids and all must be given"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        assert client.post(f"/lists/{list_id}/tasks/complete", json={}, headers=headers).status_code == 422
+        response = client.post(f"/lists/{list_id}/tasks/complete", json={"ids": ["x"], "all": True}, headers=headers)
+        assert response.status_code == 422
+
+    def test_complete_tasks_list_not_found(self, client: TestClient, authenticated_user):
+        """Test bulk completion for non-existent list"""
+        response = client.post("/lists/999/tasks/complete", json={"all": True}, headers=authenticated_user["headers"])
+
+        assert response.status_code == 404
+
+    def test_clear_completed_tasks(self, client: TestClient, todo_list_with_tasks):
+        """Test deleting only the completed tasks of a list"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        done_id = todo_list_with_tasks["tasks"][0]["id"]
+        client.post(f"/tasks/{done_id}/complete", headers=headers)
+
+        response = client.delete(f"/lists/{list_id}/tasks?completed=true", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+        remaining = client.get(f"/lists/{list_id}/tasks", headers=headers).json()
+        assert len(remaining) == 2 and done_id not in {task["id"] for task in remaining}
+
+    def test_delete_selected_tasks(self, client: TestClient, todo_list_with_tasks):
+        """Test bulk deletion by ids"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        ids = [task["id"] for task in todo_list_with_tasks["tasks"][:2]]
+
+        response = client.post(f"/lists/{list_id}/tasks/delete", json={"ids": ids}, headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+        assert len(client.get(f"/lists/{list_id}/tasks", headers=headers).json()) == 1
+
+        response = client.post(f"/lists/{list_id}/tasks/delete", json={"all": True}, headers=headers)
+        assert response.json()["count"] == 1
+
+    def test_clear_tasks_rejects_other_selections(self, client: TestClient, todo_list_with_tasks):
+        """Test that a bare or completed=false DELETE never wipes the list"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        assert client.delete(f"/lists/{list_id}/tasks", headers=headers).status_code == 422
+        assert client.delete(f"/lists/{list_id}/tasks?completed=false", headers=headers).status_code == 422
+        assert len(client.get(f"/lists/{list_id}/tasks", headers=headers).json()) == 3
+
+    def test_clear_tasks_list_not_found(self, client: TestClient, authenticated_user):
+        """Test clearing tasks of a non-existent list"""
+        response = client.delete("/lists/999/tasks?completed=true", headers=authenticated_user["headers"])
+
+        assert response.status_code == 404
+
     def test_get_tasks_success(self, client: TestClient, todo_list_with_tasks):
         """Test getting tasks from a todo list"""
         headers = todo_list_with_tasks["headers"]
@@ -110,6 +266,38 @@ class TestTasksRoutes:
         assert all("id" in task for task in data)
         assert all("description" in task for task in data)
 
+    def test_get_tasks_paginated(self, client: TestClient, todo_list_with_tasks):
+        """Test that limit/cursor page through tasks with Link and X-Next-Cursor headers"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        response = client.get(f"/lists/{list_id}/tasks?limit=2", headers=headers)
+
+        assert response.status_code == 200
+        first = response.json()
+        assert len(first) == 2
+        cursor = response.headers["X-Next-Cursor"]
+        assert 'rel="next"' in response.headers["Link"]
+        assert f"cursor={cursor}" in response.headers["Link"]
+
+        response = client.get(f"/lists/{list_id}/tasks?limit=2&cursor={cursor}", headers=headers)
+
+        assert response.status_code == 200
+        second = response.json()
+        assert len(second) == 1
+        assert "X-Next-Cursor" not in response.headers and "Link" not in response.headers
+        created = {task["id"] for task in todo_list_with_tasks["tasks"]}
+        assert {task["id"] for task in first + second} == created
+
+    def test_get_tasks_invalid_cursor(self, client: TestClient, todo_list_with_tasks):
+        """Test that a malformed cursor is rejected"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        response = client.get(f"/lists/{list_id}/tasks?cursor=bogus", headers=headers)
+
+        assert response.status_code == 400
+
     def test_get_tasks_without_authentication(self, client: TestClient):
         """Test getting tasks without authentication"""
         response = client.get("/lists/1/tasks")
@@ -277,3 +465,50 @@ class TestTasksRoutes:
         assert len(completed_tasks) == 1
         assert len(incomplete_tasks) == 2
         assert completed_tasks[0]["id"] == task_id
+
+    def test_filter_completed_tasks_server_side(self, client: TestClient, todo_list_with_tasks):
+        """Test ?completed= filtering in the query instead of the client"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        task_id = todo_list_with_tasks["tasks"][0]["id"]
+        client.post(f"/tasks/{task_id}/complete", headers=headers)
+
+        response = client.get(f"/lists/{list_id}/tasks?completed=true", headers=headers)
+        assert response.status_code == 200
+        assert [task["id"] for task in response.json()] == [task_id]
+
+        response = client.get(f"/lists/{list_id}/tasks?completed=false", headers=headers)
+        assert len(response.json()) == 2 and task_id not in {task["id"] for task in response.json()}
+
+    def test_sort_tasks_by_description(self, client: TestClient, todo_list_with_tasks):
+        """Test ?sort=description"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+        client.post(f"/lists/{list_id}/tasks", json={"description": "A first"}, headers=headers)
+
+        response = client.get(f"/lists/{list_id}/tasks?sort=description", headers=headers)
+
+        assert response.status_code == 200
+        descriptions = [task["description"] for task in response.json()]
+        assert descriptions == sorted(descriptions) and descriptions[0] == "A first"
+
+    def test_created_after_filter(self, client: TestClient, todo_list_with_tasks):
+        """Test ?created_after= with a timestamp after every task"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        response = client.get(
+            f"/lists/{list_id}/tasks", params={"created_after": "2999-01-01T00:00:00Z"}, headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_invalid_sort(self, client: TestClient, todo_list_with_tasks):
+        """Test that unknown ?sort= values are rejected"""
+        headers = todo_list_with_tasks["headers"]
+        list_id = todo_list_with_tasks["list"]["id"]
+
+        response = client.get(f"/lists/{list_id}/tasks?sort=priority", headers=headers)
+
+        assert response.status_code == 422
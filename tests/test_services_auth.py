@@ -0,0 +1,89 @@
+"""
+Unit tests for AuthService
+"""
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.user import UserCreate
+
+
+class TestAuthServiceCreateUser:
+    """Test cases for AuthService.create_user"""
+
+    def test_create_user_is_a_single_insert(self, auth_service, sample_user_data, statements):
+        """Test that registration issues one INSERT and no SELECT"""
+        user = auth_service.create_user(UserCreate(**sample_user_data))
+
+        assert user.id is not None
+        assert user.created_at is not None  # returned by INSERT ... RETURNING
+        assert len(statements) == 1, statements
+        assert statements[0].lstrip().upper().startswith("INSERT INTO USERS")
+
+    def test_duplicate_email(self, auth_service, sample_user_data):
+        """Test that the unique email constraint maps to the existing message"""
+        auth_service.create_user(UserCreate(**sample_user_data))
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth_service.create_user(UserCreate(**{**sample_user_data, "username": "other"}))
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Email already registered"
+
+    def test_duplicate_username(self, auth_service, sample_user_data):
+        """Test that the unique username constraint maps to the existing message"""
+        auth_service.create_user(UserCreate(**sample_user_data))
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth_service.create_user(UserCreate(**{**sample_user_data, "email": "other@example.com"}))
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Username already exists"
+
+    def test_duplicate_email_that_mentions_username(self, auth_service):
+        """Test that the constraint, not the value, decides the message"""
+        user_data = {"email": "username@example.com", "password": "TestPassword123!"}
+        auth_service.create_user(UserCreate(**user_data))
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth_service.create_user(UserCreate(**user_data))
+
+        assert exc_info.value.detail == "Email already registered"
+
+    def test_session_usable_after_duplicate(self, auth_service, sample_user_data):
+        """Test that the session is rolled back after a constraint violation"""
+        auth_service.create_user(UserCreate(**sample_user_data))
+        with pytest.raises(HTTPException):
+            auth_service.create_user(UserCreate(**sample_user_data))
+
+        user = auth_service.create_user(UserCreate(
+            email="next@example.com", username="next", password="TestPassword123!"
+        ))
+        assert auth_service.get_user_by_id(user.id) is not None
+
+
+class TestAsyncAuthServiceCreateUser:
+    """Test cases for AsyncAuthService.create_user"""
+
+    def test_no_connection_held_while_hashing(self, db_session, sample_user_data, monkeypatch):
+        """Test that the database connection is only checked out after the password hash"""
+        import asyncio
+        from app.services.auth_service import AsyncAuthService
+        from app.utils.hashing import password_hasher
+
+        during_hash = []
+
+        async def slow_hash(password):
+            # Give a concurrently started checkout time to happen
+            for _ in range(50):
+                if db_session.in_transaction():
+                    break
+                await asyncio.sleep(0.01)
+            during_hash.append(db_session.in_transaction())
+            return "hashed"
+
+        monkeypatch.setattr(password_hasher, "hash", slow_hash)
+
+        user = asyncio.run(AsyncAuthService(db_session).create_user(UserCreate(**sample_user_data)))
+
+        assert user.hashed_password == "hashed"
+        assert during_hash == [False]
@@ -0,0 +1,146 @@
+"""
+Tests for ListService write paths
+"""
+import pytest
+from fastapi import HTTPException
+from app.models.list import List
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.list import ListCreate, ListUpdate
+from app.services.lists_service import ListService
+
+
+@pytest.fixture
+def owners(db_session):
+    """Two users; the first owns one list"""
+    owner = User(id="owner", email="owner@example.com", hashed_password="x")
+    other = User(id="other", email="other@example.com", hashed_password="x")
+    db_session.add_all([owner, other, List(id="list-1", name="Owned", user_id=owner.id)])
+    db_session.commit()
+    return owner, other
+
+
+class TestListServiceWrites:
+    """Test cases asserting one statement per list write"""
+
+    def test_create_list_is_one_insert(self, db_session, owners, statements):
+        """Test that create_list gets created_at back without a refresh SELECT"""
+        owner, _ = owners
+        new_list = ListService(db_session).create_list(ListCreate(name="New"), owner)
+
+        assert new_list.created_at is not None
+        assert new_list.updated_at is None
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("INSERT INTO lists") and "RETURNING" in statements[0]
+
+    def test_update_list_is_one_update_returning(self, db_session, owners, statements):
+        """Test that update_list is a single ownership-scoped UPDATE ... RETURNING"""
+        owner, _ = owners
+        updated = ListService(db_session).update_list("list-1", ListUpdate(name="Renamed"), owner)
+
+        assert updated.name == "Renamed"
+        assert updated.created_at is not None and updated.updated_at is not None
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("UPDATE lists") and "RETURNING" in statements[0]
+
+    def test_update_foreign_list(self, db_session, owners):
+        """Test that another user's list is neither renamed nor revealed"""
+        _, other = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            ListService(db_session).update_list("list-1", ListUpdate(name="Hijacked"), other)
+        assert exc_info.value.status_code == 404
+
+        db_session.expire_all()
+        assert db_session.get(List, "list-1").name == "Owned"
+
+
+class TestCascadingDeletes:
+    """Test cases for deletes that rely on ON DELETE CASCADE"""
+
+    @pytest.fixture
+    def many_tasks(self, db_session, owners):
+        db_session.add_all(
+            [Task(id=f"task-{i}", list_id="list-1", description=str(i)) for i in range(200)]
+        )
+        db_session.commit()
+        db_session.expunge_all()
+        return owners
+
+    def test_delete_list_is_one_delete(self, db_session, many_tasks, statements):
+        """Test that deleting a list never loads its tasks"""
+        owner, _ = many_tasks
+
+        assert ListService(db_session).delete_list("list-1", owner) is True
+
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("DELETE FROM lists") and "RETURNING" in statements[0]
+        assert db_session.query(Task).count() == 0
+
+    def test_delete_foreign_list(self, db_session, many_tasks):
+        """Test that another user's list and tasks survive a delete attempt"""
+        _, other = many_tasks
+
+        with pytest.raises(HTTPException) as exc_info:
+            ListService(db_session).delete_list("list-1", other)
+        assert exc_info.value.status_code == 404
+        assert db_session.query(Task).count() == 200
+
+    def test_delete_user_does_not_load_lists(self, db_session, many_tasks, statements):
+        """Test that deleting a user leaves lists and tasks to the database"""
+        owner, _ = many_tasks
+        user = db_session.get(User, owner.id)
+        statements.clear()
+
+        db_session.delete(user)
+        db_session.commit()
+
+        assert [statement.split()[0] for statement in statements] == ["DELETE"], statements
+        assert db_session.query(List).count() == 0
+        assert db_session.query(Task).count() == 0
+
+
+class TestListPagination:
+    """Test cases for keyset-paged get_user_lists"""
+
+    def test_pages_cover_every_list_once(self, db_session, owners):
+        """Test that following next_cursor visits every list in (created_at, id) order"""
+        owner, _ = owners
+        # Same created_at second for all of them: the id breaks the ties
+        db_session.add_all([List(id=f"list-{i:02d}", name=str(i), user_id=owner.id) for i in range(2, 12)])
+        db_session.commit()
+        service = ListService(db_session)
+
+        seen, cursor = [], None
+        while True:
+            page = service.get_user_lists(owner, limit=3, cursor=cursor)
+            assert len(page.items) <= 3
+            seen.extend(item.id for item in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert seen == ["list-02", "list-03", "list-04", "list-05", "list-06", "list-07",
+                        "list-08", "list-09", "list-1", "list-10", "list-11"]
+
+    def test_default_limit_comes_from_settings(self, db_session, owners, monkeypatch):
+        """Test that PAGE_DEFAULT_LIMIT applies without a limit and PAGE_MAX_LIMIT caps it"""
+        from app.config import settings
+
+        owner, _ = owners
+        db_session.add_all([List(id=f"extra-{i}", name=str(i), user_id=owner.id) for i in range(4)])
+        db_session.commit()
+        monkeypatch.setattr(settings, "page_default_limit", 2)
+        monkeypatch.setattr(settings, "page_max_limit", 3)
+        service = ListService(db_session)
+
+        assert len(service.get_user_lists(owner).items) == 2
+        assert len(service.get_user_lists(owner, limit=50).items) == 3
+
+    def test_invalid_cursor(self, db_session, owners):
+        """Test that a tampered cursor is a 400, not a server error"""
+        owner, _ = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            ListService(db_session).get_user_lists(owner, cursor="not-a-cursor")
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,329 @@
+"""
+Tests for TaskService ownership-scoped queries
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import update
+from app.models.list import List
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.task import TaskBulkSelection, TaskCreate, TaskUpdate
+from app.services.task_service import TaskService
+
+
+@pytest.fixture
+def owners(db_session):
+    """Two users; only the first owns a list with one task"""
+    owner = User(id="owner", email="owner@example.com", hashed_password="x")
+    other = User(id="other", email="other@example.com", hashed_password="x")
+    todo_list = List(id="list-1", name="Owned", user_id=owner.id)
+    empty_list = List(id="list-2", name="Empty", user_id=owner.id)
+    task = Task(id="task-1", list_id=todo_list.id, description="Owned task", completed=False)
+    db_session.add_all([owner, other, todo_list, empty_list, task])
+    db_session.commit()
+    return owner, other
+
+
+class TestTaskServiceOwnership:
+    """Test cases for single-statement, ownership-scoped task access"""
+
+    def test_create_task_is_one_insert_select(self, db_session, owners, statements):
+        """Test that create_task checks the list and inserts in one INSERT ... SELECT ... RETURNING"""
+        owner, _ = owners
+        task = TaskService(db_session).create_task("list-2", TaskCreate(description="New"), owner)
+
+        assert task.list_id == "list-2" and task.completed is False
+        assert task.created_at is not None
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("INSERT INTO tasks") and "RETURNING" in statements[0]
+
+    def test_create_task_in_foreign_list(self, db_session, owners):
+        """Test that nothing is inserted into a list the user does not own"""
+        _, other = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).create_task("list-1", TaskCreate(description="Nope"), other)
+        assert exc_info.value.status_code == 404
+        assert db_session.query(Task).count() == 1
+
+    def test_create_tasks_is_one_check_and_one_insert(self, db_session, owners, statements):
+        """Test that create_tasks checks ownership once and inserts every row in one statement"""
+        owner, _ = owners
+        batch = [TaskCreate(description=f"Batch {i}") for i in range(50)]
+        tasks = TaskService(db_session).create_tasks("list-2", batch, owner)
+
+        assert [task.description for task in tasks] == [f"Batch {i}" for i in range(50)]
+        assert all(task.created_at is not None for task in tasks)
+        assert len(statements) == 2, statements
+        assert statements[0].startswith("SELECT lists.id")
+        assert statements[1].startswith("INSERT INTO tasks") and "RETURNING" in statements[1]
+
+    def test_create_tasks_in_foreign_list(self, db_session, owners):
+        """Test that a batch for another user's list inserts nothing"""
+        _, other = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).create_tasks("list-1", [TaskCreate(description="Nope")], other)
+        assert exc_info.value.status_code == 404
+        assert db_session.query(Task).count() == 1
+
+    def test_set_task_completed_is_one_update(self, db_session, owners, statements):
+        """Test that completing a task is one ownership-scoped UPDATE ... RETURNING"""
+        owner, _ = owners
+        task = TaskService(db_session).set_task_completed("task-1", True, owner)
+
+        assert task.completed is True
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("UPDATE tasks") and "RETURNING" in statements[0]
+
+    def test_set_tasks_completed_is_one_update(self, db_session, owners, statements):
+        """Test that the bulk variant is one set-based UPDATE that skips unchanged rows"""
+        owner, _ = owners
+        db_session.add_all(
+            [Task(id=f"bulk-{i}", list_id="list-1", description="Bulk", completed=i == 0) for i in range(3)]
+        )
+        db_session.commit()
+        statements.clear()
+
+        count = TaskService(db_session).set_tasks_completed(
+            "list-1", TaskBulkSelection(all=True), True, owner
+        )
+
+        assert count == 3
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("UPDATE tasks")
+        db_session.expire_all()
+        assert db_session.query(Task).filter(Task.completed.is_(False)).count() == 0
+
+    def test_set_tasks_completed_by_ids(self, db_session, owners):
+        """Test that only the selected tasks of the list change"""
+        owner, _ = owners
+        db_session.add(Task(id="task-2", list_id="list-1", description="Other", completed=False))
+        db_session.commit()
+
+        count = TaskService(db_session).set_tasks_completed(
+            "list-1", TaskBulkSelection(ids=["task-2", "missing"]), True, owner
+        )
+
+        assert count == 1
+        db_session.expire_all()
+        assert db_session.get(Task, "task-1").completed is False
+        assert db_session.get(Task, "task-2").completed is True
+
+    def test_set_tasks_completed_in_foreign_list(self, db_session, owners):
+        """Test that another user's list is neither changed nor revealed"""
+        _, other = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).set_tasks_completed("list-1", TaskBulkSelection(all=True), True, other)
+        assert exc_info.value.status_code == 404
+
+        db_session.expire_all()
+        assert db_session.get(Task, "task-1").completed is False
+
+    def test_delete_completed_tasks_is_one_delete(self, db_session, owners, statements):
+        """Test that clearing completed tasks is one ownership-scoped DELETE"""
+        owner, _ = owners
+        db_session.add_all(
+            [Task(id=f"done-{i}", list_id="list-1", description="Done", completed=True) for i in range(3)]
+        )
+        db_session.commit()
+        statements.clear()
+
+        count = TaskService(db_session).delete_tasks("list-1", owner, completed=True)
+
+        assert count == 3
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("DELETE FROM tasks")
+        assert [task.id for task in db_session.query(Task).all()] == ["task-1"]
+
+    def test_delete_tasks_by_ids(self, db_session, owners):
+        """Test that only the selected tasks of the list are deleted"""
+        owner, _ = owners
+        db_session.add(Task(id="task-2", list_id="list-1", description="Other"))
+        db_session.commit()
+
+        count = TaskService(db_session).delete_tasks("list-1", owner, ids=["task-2", "missing"])
+
+        assert count == 1
+        assert [task.id for task in db_session.query(Task).all()] == ["task-1"]
+
+    def test_delete_tasks_in_foreign_list(self, db_session, owners):
+        """Test that another user's tasks are neither deleted nor revealed"""
+        _, other = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).delete_tasks("list-1", other, all=True)
+        assert exc_info.value.status_code == 404
+        assert db_session.query(Task).count() == 1
+
+    def test_delete_tasks_requires_a_selection(self, db_session, owners):
+        """Test that no ids, no completed filter and no all=True deletes nothing"""
+        owner, _ = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).delete_tasks("list-1", owner)
+        assert exc_info.value.status_code == 422
+        assert db_session.query(Task).count() == 1
+
+    def test_get_task_by_id_is_one_query(self, db_session, owners, statements):
+        """Test that fetching a task checks ownership in the same SELECT"""
+        owner, other = owners
+        service = TaskService(db_session)
+
+        assert service.get_task_by_id("task-1", owner).description == "Owned task"
+        assert len(statements) == 1
+        assert service.get_task_by_id("task-1", other) is None
+
+    def test_get_tasks_by_list_is_one_query(self, db_session, owners, statements):
+        """Test that list ownership and the task fetch share one statement"""
+        owner, other = owners
+        service = TaskService(db_session)
+
+        assert [task.id for task in service.get_tasks_by_list("list-1", owner).items] == ["task-1"]
+        assert service.get_tasks_by_list("list-2", owner).items == []
+        assert len(statements) == 2
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_tasks_by_list("list-1", other)
+        assert exc_info.value.status_code == 404
+
+    def test_update_task_is_one_update_returning(self, db_session, owners, statements):
+        """Test that update_task is a single UPDATE ... RETURNING"""
+        owner, _ = owners
+        task = TaskService(db_session).update_task("task-1", TaskUpdate(completed=True), owner)
+
+        assert task.completed is True
+        assert task.updated_at is not None
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("UPDATE tasks") and "RETURNING" in statements[0]
+
+    def test_update_foreign_task_changes_nothing(self, db_session, owners):
+        """Test that another user's task is neither updated nor revealed"""
+        _, other = owners
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).update_task("task-1", TaskUpdate(description="Hijacked"), other)
+        assert exc_info.value.status_code == 404
+
+        db_session.expire_all()
+        assert db_session.get(Task, "task-1").description == "Owned task"
+
+    def test_delete_task_is_one_delete(self, db_session, owners, statements):
+        """Test that delete_task is a single ownership-scoped DELETE"""
+        owner, other = owners
+        service = TaskService(db_session)
+
+        with pytest.raises(HTTPException):
+            service.delete_task("task-1", other)
+        statements.clear()
+
+        assert service.delete_task("task-1", owner) is True
+        assert len(statements) == 1, statements
+        assert statements[0].startswith("DELETE FROM tasks")
+        assert db_session.get(Task, "task-1") is None
+
+
+class TestTaskListing:
+    """Test cases for filters and sorts pushed into get_tasks_by_list"""
+
+    @pytest.fixture
+    def dated_tasks(self, db_session, owners):
+        """Tasks with fixed timestamps; only "b" was updated since"""
+        owner, _ = owners
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        rows = [("c", "Cherry", True, 0, None), ("a", "apple", False, 1, None), ("b", "Banana", False, 2, 5)]
+        for id, description, completed, created, updated in rows:
+            db_session.add(Task(id=id, list_id="list-2", description=description, completed=completed))
+        db_session.commit()
+        for id, _, _, created, updated in rows:
+            db_session.execute(
+                update(Task)
+                .where(Task.id == id)
+                .values(
+                    created_at=base + timedelta(hours=created),
+                    updated_at=None if updated is None else base + timedelta(hours=updated),
+                )
+            )
+        db_session.commit()
+        return owner, base
+
+    def ids(self, page):
+        return [task.id for task in page.items]
+
+    def test_sorts(self, db_session, dated_tasks):
+        """Test each ?sort= order, with updated_at falling back to created_at"""
+        owner, _ = dated_tasks
+        service = TaskService(db_session)
+
+        assert self.ids(service.get_tasks_by_list("list-2", owner)) == ["c", "a", "b"]
+        assert self.ids(service.get_tasks_by_list("list-2", owner, sort="updated_at")) == ["c", "a", "b"]
+        assert self.ids(service.get_tasks_by_list("list-2", owner, sort="description")) == ["b", "c", "a"]
+
+    def test_filters(self, db_session, dated_tasks):
+        """Test completed, created_after and updated_after"""
+        owner, base = dated_tasks
+        service = TaskService(db_session)
+
+        assert self.ids(service.get_tasks_by_list("list-2", owner, completed=True)) == ["c"]
+        assert self.ids(service.get_tasks_by_list("list-2", owner, completed=False)) == ["a", "b"]
+        after = base + timedelta(minutes=30)
+        assert self.ids(service.get_tasks_by_list("list-2", owner, created_after=after)) == ["a", "b"]
+        assert self.ids(service.get_tasks_by_list("list-2", owner, updated_after=base + timedelta(hours=3))) == ["b"]
+
+    def test_aware_filter_is_compared_in_utc(self, db_session, dated_tasks):
+        """Test that an offset timestamp means the same instant as its UTC equivalent"""
+        owner, base = dated_tasks
+        jakarta = timezone(timedelta(hours=7))
+        after = (base + timedelta(minutes=30)).replace(tzinfo=timezone.utc).astimezone(jakarta)
+
+        page = TaskService(db_session).get_tasks_by_list("list-2", owner, created_after=after)
+
+        assert self.ids(page) == ["a", "b"]
+
+    def test_sorted_pages_follow_cursor(self, db_session, dated_tasks):
+        """Test that paging a non-default sort keeps that order"""
+        owner, _ = dated_tasks
+        service = TaskService(db_session)
+
+        first = service.get_tasks_by_list("list-2", owner, limit=2, sort="description")
+        second = service.get_tasks_by_list("list-2", owner, limit=2, cursor=first.next_cursor, sort="description")
+
+        assert self.ids(first) + self.ids(second) == ["b", "c", "a"]
+        assert second.next_cursor is None
+
+    def test_cursor_from_other_sort(self, db_session, dated_tasks):
+        """Test that a cursor issued for one sort is rejected for another"""
+        owner, _ = dated_tasks
+        service = TaskService(db_session)
+        first = service.get_tasks_by_list("list-2", owner, limit=1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_tasks_by_list("list-2", owner, cursor=first.next_cursor, sort="description")
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("value", [[1, 2], {"a": 1}, 1, None])
+    def test_cursor_value_of_wrong_type(self, db_session, dated_tasks, value):
+        """Test that a crafted cursor whose sort value is not text is a 400, not a database error"""
+        import base64
+        import json
+
+        owner, _ = dated_tasks
+        raw = json.dumps(["description", value, "task-1"]).encode()
+        cursor = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+        with pytest.raises(HTTPException) as exc_info:
+            TaskService(db_session).get_tasks_by_list("list-2", owner, cursor=cursor, sort="description")
+        assert exc_info.value.status_code == 400
+
+    def test_no_match_is_empty_not_missing(self, db_session, dated_tasks):
+        """Test that filters excluding every task still return an empty page, not 404"""
+        owner, _ = dated_tasks
+
+        page = TaskService(db_session).get_tasks_by_list(
+            "list-2", owner, created_after=datetime(2030, 1, 1)
+        )
+
+        assert page.items == [] and page.next_cursor is None
@@ -1,11 +1,16 @@
 """
 Tests for utility functions and dependencies
 """
+import asyncio
 import pytest
 from fastapi import HTTPException
 from starlette.testclient import TestClient
-from app.utils.security import generate_id, verify_password, get_password_hash, create_access_token, verify_token
+from app.utils.security import generate_id, verify_password, get_password_hash, create_access_token, verify_token, token_cache
 from app.utils.dependencies import get_current_user, get_current_active_user
+from app.utils.auth_cache import Principal, credential_cache, invalidate_user, principal_cache
+from app.utils.cache import TTLCache
+from app.utils.hashing import PasswordHashExecutor, password_hasher
+from app.utils.rate_limit import InMemoryRateLimitBackend, RateLimiter, RateLimitRule, _load_backend, rate_limiter
 from datetime import timedelta
 
 
@@ -22,7 +27,25 @@ class TestSecurity:
         assert isinstance(id1, str)
         assert isinstance(id2, str)
 
-    def test_password_hashing(self):
+    def test_generate_id_is_time_ordered(self, monkeypatch):
+        """Test that IDs are UUIDv7 and sort in creation order, even within one millisecond"""
+        import uuid
+        import app.utils.ids as ids
+
+        monkeypatch.setattr(ids, "_last_ms", 0)
+        monkeypatch.setattr(ids, "_counter", 0)
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+        same_ms = [generate_id() for _ in range(100)]
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 1_700_000_000_001_000_000)
+        later = generate_id()
+
+        assert same_ms == sorted(same_ms) and same_ms[-1] < later
+        assert len(set(same_ms)) == 100
+        parsed = uuid.UUID(hex=later)
+        assert parsed.version == 7
+        assert parsed.int >> 80 == 1_700_000_000_001
+
+
         """Test password hashing and verification"""
         password = "TestPassword123!"
         
@@ -67,6 +90,104 @@ class TestSecurity:
         invalid_result = verify_token("invalid.token.here")
         assert invalid_result is None
 
+    def test_verify_token_uses_cache(self):
+        """Test that a repeated token is served from the decoded-token cache"""
+        token = create_access_token({"sub": "cached-user"})
+
+        assert verify_token(token) == "cached-user"
+        hits_before = token_cache.stats()["hits"]
+        assert verify_token(token) == "cached-user"
+        assert token_cache.stats()["hits"] == hits_before + 1
+
+    def test_verify_token_never_serves_expired_entries(self):
+        """Test that a cache entry past its exp claim is ignored"""
+        import time
+        token = create_access_token({"sub": "real-user"})
+        token_cache.set(token, ("stale-user", time.time() - 1), ttl=60)
+
+        assert verify_token(token) == "real-user"
+
+    def test_invalid_tokens_are_not_cached(self):
+        """Test that failed verifications are not cached"""
+        assert verify_token("invalid.token.here") is None
+        assert token_cache.get("invalid.token.here") is None
+
+
+class TestPasswordHashConfiguration:
+    """Test cases for configurable password hashing"""
+
+    def test_configured_bcrypt_rounds(self):
+        """Test that new hashes use the configured bcrypt cost"""
+        from app.config import settings
+        hashed = get_password_hash("TestPassword123!")
+        assert hashed.startswith(f"$2b${settings.bcrypt_rounds:02d}$")
+
+    def test_outdated_hash_is_reported(self):
+        """Test that a hash with a different cost needs an update"""
+        from passlib.context import CryptContext
+        from app.utils.security import verify_and_update_password
+
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("TestPassword123!")
+        verified, new_hash = verify_and_update_password("TestPassword123!", old_hash)
+        assert verified is True
+        assert new_hash is not None and new_hash != old_hash
+
+        verified, new_hash = verify_and_update_password("WrongPassword123!", old_hash)
+        assert verified is False
+        assert new_hash is None
+
+    def test_argon2_scheme(self, monkeypatch):
+        """Test building an argon2 context that still verifies bcrypt hashes"""
+        pytest.importorskip("argon2")
+        from app.config import settings
+        from app.utils.security import build_password_context
+
+        bcrypt_hash = get_password_hash("TestPassword123!")
+        monkeypatch.setattr(settings, "password_hash_scheme", "argon2")
+        monkeypatch.setattr(settings, "argon2_memory_cost", 1024)
+        monkeypatch.setattr(settings, "argon2_parallelism", 1)
+        context = build_password_context()
+
+        assert context.hash("TestPassword123!").startswith("$argon2")
+        assert context.verify("TestPassword123!", bcrypt_hash) is True
+        assert context.needs_update(bcrypt_hash) is True
+
+    def test_unsupported_scheme(self, monkeypatch):
+        """Test that an unknown scheme is rejected"""
+        from app.config import settings
+        from app.utils.security import build_password_context
+
+        monkeypatch.setattr(settings, "password_hash_scheme", "md5")
+        with pytest.raises(ValueError):
+            build_password_context()
+
+    def test_calibration(self):
+        """Test that calibration reports a positive duration"""
+        from app.utils.security import calibrate_password_hash, describe_password_hash
+        assert calibrate_password_hash(samples=1) > 0
+        assert "bcrypt" in describe_password_hash()
+
+    def test_login_rehashes_outdated_hash(self, client: TestClient, sample_user_data, db_session):
+        """Test that a successful login upgrades an outdated hash"""
+        from passlib.context import CryptContext
+        from app.models.user import User
+
+        client.post("/auth/register", json=sample_user_data)
+        user = db_session.query(User).filter(User.email == sample_user_data["email"]).first()
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash(sample_user_data["password"])
+        user.hashed_password = old_hash
+        db_session.commit()
+
+        response = client.post("/auth/login", json={
+            "email": sample_user_data["email"],
+            "password": sample_user_data["password"]
+        })
+        assert response.status_code == 200
+
+        db_session.refresh(user)
+        assert user.hashed_password != old_hash
+        assert verify_password(sample_user_data["password"], user.hashed_password)
+
 
 class TestDependencies:
     """Test cases for FastAPI dependencies"""
@@ -127,3 +248,356 @@ class TestDependencies:
         
         response = client.get("/auth/me", headers={"Authorization": f"Bearer {expired_token}"})
         assert response.status_code == 401
+
+
+class TestTTLCache:
+    """Test cases for the in-process TTL cache"""
+
+    def test_get_set_and_counters(self):
+        """Test hits, misses and LRU eviction"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" is now most recently used
+        cache.set("c", 3)  # evicts "b"
+
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+
+    def test_entries_expire(self):
+        """Test that expired entries are never served"""
+        now = [1000.0]
+        cache = TTLCache(maxsize=10, ttl=5, timer=lambda: now[0])
+        cache.set("a", 1)
+        now[0] += 4.9
+        assert cache.get("a") == 1
+        now[0] += 0.2
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestCredentialCache:
+    """Test cases for the Basic auth credential cache"""
+
+    def _basic_header(self, email, password):
+        import base64
+        encoded = base64.b64encode(f"{email}:{password}".encode()).decode()
+        return {"Authorization": f"Basic {encoded}"}
+
+    def test_keys_do_not_contain_plaintext(self):
+        """Test that cache keys are keyed digests, not the password"""
+        key = credential_cache._key("a@example.com", "TestPassword123!")
+        assert isinstance(key, bytes)
+        assert b"TestPassword123!" not in key
+        assert key != credential_cache._key("a@example.com", "OtherPassword123!")
+
+    def test_repeated_basic_auth_skips_password_verify(self, client: TestClient, sample_user_data, monkeypatch):
+        """Test that only the first Basic auth request runs a password verify"""
+        client.post("/auth/register", json=sample_user_data)
+        headers = self._basic_header(sample_user_data["email"], sample_user_data["password"])
+
+        submitted = password_hasher.stats()["submitted"]
+
+        for _ in range(3):
+            response = client.get("/auth/me", headers=headers)
+            assert response.status_code == 200
+
+        assert password_hasher.stats()["submitted"] - submitted == 1
+        stats = credential_cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_wrong_password_is_not_cached(self, client: TestClient, sample_user_data):
+        """Test that failed verifications are never cached"""
+        client.post("/auth/register", json=sample_user_data)
+        headers = self._basic_header(sample_user_data["email"], "WrongPassword123!")
+
+        assert client.get("/auth/me", headers=headers).status_code == 401
+        assert credential_cache.stats()["size"] == 0
+
+    def test_password_change_invalidates_cache(self, client: TestClient, sample_user_data, db_session):
+        """Test that changing hashed_password drops cached verifications"""
+        client.post("/auth/register", json=sample_user_data)
+        headers = self._basic_header(sample_user_data["email"], sample_user_data["password"])
+        assert client.get("/auth/me", headers=headers).status_code == 200
+        assert credential_cache.stats()["size"] == 1
+
+        from app.models.user import User
+        user = db_session.query(User).filter(User.email == sample_user_data["email"]).first()
+        user.hashed_password = get_password_hash("NewPassword123!")
+        db_session.commit()
+
+        assert credential_cache.stats()["size"] == 0
+        assert client.get("/auth/me", headers=headers).status_code == 401
+
+    def test_deactivation_invalidates_cache(self, client: TestClient, sample_user_data, db_session):
+        """Test that deactivating a user drops cached verifications"""
+        client.post("/auth/register", json=sample_user_data)
+        headers = self._basic_header(sample_user_data["email"], sample_user_data["password"])
+        assert client.get("/auth/me", headers=headers).status_code == 200
+
+        from app.models.user import User
+        user = db_session.query(User).filter(User.email == sample_user_data["email"]).first()
+        user.is_active = False
+        db_session.commit()
+
+        assert credential_cache.stats()["size"] == 0
+        assert client.get("/auth/me", headers=headers).status_code == 401
+
+
+class TestPasswordHashExecutor:
+    """Test cases for the password hashing executor"""
+
+    def test_hash_and_verify_on_process_pool(self):
+        """Test hashing and verification on the process pool"""
+        hasher = PasswordHashExecutor(backend="process", max_workers=1)
+
+        async def run():
+            hashed = await hasher.hash("TestPassword123!")
+            assert await hasher.verify("TestPassword123!", hashed) is True
+            assert await hasher.verify("WrongPassword123!", hashed) is False
+
+        try:
+            asyncio.run(run())
+            # Workers must not be forked from the (threaded) server process
+            assert hasher._executor._mp_context.get_start_method() in ("forkserver", "spawn")
+        finally:
+            hasher.shutdown()
+
+        stats = hasher.stats()
+        assert stats["submitted"] == 3
+        assert stats["completed"] == 3
+        assert stats["pending"] == 0
+        assert stats["peak_pending"] >= 1
+
+    def test_backlog_bound_returns_503(self):
+        """Test that a full hashing backlog is rejected with 503"""
+        hasher = PasswordHashExecutor(backend="thread", max_workers=1, max_pending=0)
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(hasher.hash("TestPassword123!"))
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers["Retry-After"] == "1"
+        assert hasher.stats()["rejected"] == 1
+        hasher.shutdown()
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend is rejected"""
+        with pytest.raises(ValueError):
+            PasswordHashExecutor(backend="gpu")
+
+    def test_login_rejected_when_backlog_full(self, client: TestClient, sample_user_data, monkeypatch):
+        """Test that login returns 503 instead of queueing unbounded work"""
+        client.post("/auth/register", json=sample_user_data)
+        monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+        response = client.post("/auth/login", json={
+            "email": sample_user_data["email"],
+            "password": sample_user_data["password"]
+        })
+        assert response.status_code == 503
+
+
+class TestPrincipalCache:
+    """Test cases for the authenticated principal cache"""
+
+    def test_bearer_requests_skip_user_select(self, client: TestClient, authenticated_user, statements):
+        """Test that repeated Bearer requests do not SELECT the user row"""
+        headers = authenticated_user["headers"]
+
+        for _ in range(3):
+            assert client.get("/lists", headers=headers).status_code == 200
+
+        assert len([s for s in statements.selects() if "FROM users" in s]) <= 1
+        assert principal_cache.stats()["hits"] >= 2
+
+    def test_user_update_invalidates_principal(self, client: TestClient, authenticated_user, db_session):
+        """Test that modifying a user drops its cached principal"""
+        headers = authenticated_user["headers"]
+        user = authenticated_user["user"]
+        assert client.get("/lists", headers=headers).status_code == 200
+        assert principal_cache.get(user.id) is not None
+
+        user.is_active = False
+        db_session.commit()
+
+        assert principal_cache.get(user.id) is None
+        assert client.get("/lists", headers=headers).status_code == 401
+
+    def test_principal_evicted_on_commit_not_flush(self, client: TestClient, authenticated_user, db_session):
+        """Test that a flushed but uncommitted user change keeps the cache until commit"""
+        headers = authenticated_user["headers"]
+        user = authenticated_user["user"]
+        assert client.get("/lists", headers=headers).status_code == 200
+
+        user.username = "renamed"
+        db_session.flush()
+        assert principal_cache.get(user.id) is not None
+
+        db_session.commit()
+        assert principal_cache.get(user.id) is None
+
+    def test_rolled_back_change_keeps_principal(self, client: TestClient, authenticated_user, db_session):
+        """Test that a rolled back user change evicts nothing, now or at a later commit"""
+        headers = authenticated_user["headers"]
+        user = authenticated_user["user"]
+        assert client.get("/lists", headers=headers).status_code == 200
+
+        user.is_active = False
+        db_session.flush()
+        db_session.rollback()
+        db_session.commit()
+
+        assert principal_cache.get(user.id) is not None
+        assert "auth_evict" not in db_session.info
+
+    def test_explicit_invalidation(self):
+        """Test invalidate_user removes the cached principal"""
+        principal = Principal(id="u1", email="u1@example.com", username=None, is_active=True)
+        principal_cache.set("u1", principal)
+        assert principal_cache.get("u1") == principal
+
+        invalidate_user("u1")
+        assert principal_cache.get("u1") is None
+
+
+class TestFlexibleAuthDependency:
+    """Test cases for the single-pass authentication dependency"""
+
+    def test_reuses_principal_from_request_state(self):
+        """Test that a principal already on request.state is returned as-is"""
+        from types import SimpleNamespace
+        from app.utils.dependencies import get_current_user_flexible
+
+        principal = Principal(id="u1", email="u1@example.com", username=None, is_active=True)
+        request = SimpleNamespace(state=SimpleNamespace(principal=principal), headers={})
+
+        assert asyncio.run(get_current_user_flexible(request, None, None, db=None)) is principal
+
+    def test_security_schemes_in_openapi(self, client: TestClient):
+        """Test that routes using flexible auth advertise both Bearer and Basic in OpenAPI"""
+        schema = client.get("/openapi.json").json()
+
+        schemes = schema["components"]["securitySchemes"]
+        assert {"type": "http", "scheme": "bearer"} in schemes.values()
+        assert {"type": "http", "scheme": "basic"} in schemes.values()
+        security = schema["paths"]["/auth/me"]["get"]["security"]
+        assert {name for requirement in security for name in requirement} == set(schemes)
+
+    def test_scheme_is_case_insensitive(self, client: TestClient, authenticated_user):
+        """Test that the Authorization scheme is matched case-insensitively"""
+        token = authenticated_user["token"]
+        response = client.get("/auth/me", headers={"Authorization": f"bearer {token}"})
+        assert response.status_code == 200
+
+    def test_malformed_basic_credentials(self, client: TestClient):
+        """Test Basic auth headers that are not valid base64 email:password"""
+        import base64
+        no_colon = base64.b64encode(b"user@example.com").decode()
+
+        for value in ("Basic not-base64!!", f"Basic {no_colon}", "Digest abc"):
+            response = client.get("/auth/me", headers={"Authorization": value})
+            assert response.status_code == 401
+
+
+class TestRateLimiter:
+    """Test cases for the token-bucket rate limiter"""
+
+    def test_backend_must_implement_interface(self):
+        """Test that a backend missing consume/reset fails at construction, not on first request"""
+        from app.utils.rate_limit import RateLimitBackend
+
+        class PartialBackend(RateLimitBackend):
+            def reset(self):
+                pass
+
+        with pytest.raises(TypeError):
+            PartialBackend()
+
+    def test_bucket_refills_over_time(self):
+        """Test burst capacity and refill rate"""
+        now = [0.0]
+        backend = InMemoryRateLimitBackend(timer=lambda: now[0])
+        rule = RateLimitRule("test", capacity=2, per_minute=60)
+
+        assert backend.consume("k", rule) == (True, 0.0)
+        assert backend.consume("k", rule) == (True, 0.0)
+        allowed, retry_after = backend.consume("k", rule)
+        assert allowed is False
+        assert retry_after == pytest.approx(1.0)
+
+        now[0] += 1.0
+        assert backend.consume("k", rule)[0] is True
+
+    def test_idle_buckets_are_evicted(self):
+        """Test that fully refilled buckets are swept from memory"""
+        now = [0.0]
+        backend = InMemoryRateLimitBackend(sweep_interval=10, timer=lambda: now[0])
+        rule = RateLimitRule("test", capacity=1, per_minute=60)
+        backend.consume("a", rule)
+        backend.consume("b", rule)
+        assert len(backend) == 2
+
+        now[0] += 30
+        backend.consume("c", rule)
+        assert len(backend) == 1
+
+    def test_login_limited_before_any_password_work(self, client: TestClient, sample_user_data, monkeypatch):
+        """Test that over-limit logins get 429 without touching the service"""
+        from app.services.auth_service import AsyncAuthService
+
+        calls = []
+        original = AsyncAuthService.authenticate_user_email
+
+        async def counting(self, email, password):
+            calls.append(email)
+            return await original(self, email, password)
+
+        monkeypatch.setattr(AsyncAuthService, "authenticate_user_email", counting)
+        capacity = rate_limiter.login_account.capacity
+        login_data = {"email": sample_user_data["email"], "password": "WrongPassword123!"}
+
+        for _ in range(capacity):
+            assert client.post("/auth/login", json=login_data).status_code == 401
+
+        response = client.post("/auth/login", json=login_data)
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert len(calls) == capacity
+
+    def test_basic_auth_failures_are_limited(self, client: TestClient, sample_user_data):
+        """Test that Basic auth brute force is limited per account"""
+        import base64
+        client.post("/auth/register", json=sample_user_data)
+        encoded = base64.b64encode(f"{sample_user_data['email']}:WrongPassword123!".encode()).decode()
+        headers = {"Authorization": f"Basic {encoded}"}
+
+        statuses = [client.get("/auth/me", headers=headers).status_code
+                    for _ in range(rate_limiter.login_account.capacity + 1)]
+        assert statuses[-1] == 429
+        assert set(statuses[:-1]) == {401}
+
+    def test_cached_basic_auth_is_not_limited(self, client: TestClient, sample_user_data):
+        """Test that verified (cached) Basic credentials do not consume tokens"""
+        import base64
+        client.post("/auth/register", json=sample_user_data)
+        encoded = base64.b64encode(f"{sample_user_data['email']}:{sample_user_data['password']}".encode()).decode()
+        headers = {"Authorization": f"Basic {encoded}"}
+
+        for _ in range(rate_limiter.login_account.capacity + 5):
+            assert client.get("/auth/me", headers=headers).status_code == 200
+
+    def test_backend_is_swappable(self):
+        """Test loading a backend from a dotted path"""
+        backend = _load_backend("app.utils.rate_limit.InMemoryRateLimitBackend")
+        assert isinstance(backend, InMemoryRateLimitBackend)
+
+        limiter = RateLimiter(backend, enabled=False)
+        for _ in range(100):
+            limiter.check(limiter.register_ip, "1.2.3.4")